@@ -9,8 +9,8 @@ from repositories.accounts import AccountRepository
 from repositories.budgets import BudgetRepository
 from repositories.categories import CategoryRepository
 from repositories.transactions import TransactionRepository
-from reports.accrual_spending_summary import AccrualSpendingSummaryReport
-from reports.cash_spending_summary import CashSpendingSummaryReport
+from reports.months import iter_months
+from reports.period_spending_summary import PeriodSpendingSummaryReport
 
 
 def _transaction_to_dict(t) -> dict:
@@ -126,25 +126,25 @@ def get_transactions_summary():
             {"error": "bad_request", "message": "'end' must not be before 'start'"}
         ), 400
 
-    cash_report = CashSpendingSummaryReport(current_app.db_manager)
-    accrual_report = AccrualSpendingSummaryReport(current_app.db_manager)
+    # Format each month key once and share it between both bases
+    month_keys = [
+        f"{year:04d}/{month:02d}"
+        for year, month in iter_months(start_year, start_month, end_year, end_month)
+    ]
 
-    cash_basis: dict = {}
-    accrual_basis: dict = {}
-
-    year, month = start_year, start_month
-    while (year, month) <= (end_year, end_month):
-        month_key = f"{year:04d}/{month:02d}"
-        cash_summary = cash_report.run(year, month)
-        accrual_summary = accrual_report.run(year, month)
-
-        cash_basis[month_key] = _serialize_summary(cash_summary)
-        accrual_basis[month_key] = _serialize_summary(accrual_summary)
+    # Both bases come from one query, so they reflect the same snapshot
+    cash_summaries, accrual_summaries = PeriodSpendingSummaryReport(
+        current_app.db_manager
+    ).run_cash_and_accrual(start_year, start_month, end_year, end_month)
 
-        month += 1
-        if month > 12:
-            month = 1
-            year += 1
+    cash_basis = {
+        key: _serialize_summary(summary)
+        for key, summary in zip(month_keys, cash_summaries)
+    }
+    accrual_basis = {
+        key: _serialize_summary(summary)
+        for key, summary in zip(month_keys, accrual_summaries)
+    }
 
     return jsonify({"cash_basis": cash_basis, "accrual_basis": accrual_basis})
 
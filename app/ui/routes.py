@@ -31,17 +31,12 @@ def _parse_month(value: str):
 
 def _adjacent_months(year: int, month: int):
     """Return (prev_year, prev_month, next_year, next_month) for navigation."""
-    if month == 1:
-        prev_year, prev_month = year - 1, 12
-    else:
-        prev_year, prev_month = year, month - 1
-
-    if month == 12:
-        next_year, next_month = year + 1, 1
-    else:
-        next_year, next_month = year, month + 1
-
-    return prev_year, prev_month, next_year, next_month
+    # Step on the continuous month index (year * 12 + month - 1); divmod
+    # handles the year rollover in both directions
+    index = year * 12 + month - 1
+    prev_year, prev_month0 = divmod(index - 1, 12)
+    next_year, next_month0 = divmod(index + 1, 12)
+    return prev_year, prev_month0 + 1, next_year, next_month0 + 1
 
 
 @ui_bp.route("/transactions")
@@ -351,8 +351,6 @@ def cmd_set_amortization(args, db_manager, config, output):
         config: Application configuration
         output: OutputWriter for typed data output
     """
-    from dateutil.relativedelta import relativedelta
-
     transactions_repo = TransactionRepository(db_manager)
 
     transaction_id = args.transaction_id
@@ -369,18 +367,10 @@ def cmd_set_amortization(args, db_manager, config, output):
         logger.error(f"Transaction with ID '{transaction_id}' not found.")
         sys.exit(1)
 
-    # Calculate amortize_end_date using month-boundary convention:
-    # - Give full month accrual to any month the transaction touches
-    # - End on last day of month before the actual anniversary date
-    # Example: Jan 15, 2024 + 12 months → Dec 31, 2024 (not Jan 15, 2025)
-    amortize_end_date = transaction.transaction_date + relativedelta(
-        months=months - 1, day=31
-    )
-
-    # Update transaction
+    # Update transaction (end date follows the month-boundary convention,
+    # e.g. Jan 15, 2024 + 12 months → Dec 31, 2024)
     try:
-        transaction.amortize_months = months
-        transaction.amortize_end_date = amortize_end_date
+        transaction.set_amortization(months)
         success = transactions_repo.update(
             transaction, ["amortize_months", "amortize_end_date"]
         )
@@ -0,0 +1,4 @@
+-- Index supports the per-account "newest first" listing (find_by_account,
+-- find_historical_for_categorization) without a scan and temp-B-tree sort.
+CREATE INDEX IF NOT EXISTS idx_transactions_account_date
+  ON transactions(account_id, transaction_date DESC);
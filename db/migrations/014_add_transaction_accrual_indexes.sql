@@ -0,0 +1,12 @@
+-- Partial index for the accrual query (get_accrued_transactions_by_month).
+-- Only amortized rows are indexed; it replaces the full amortize_end_date index.
+DROP INDEX IF EXISTS idx_transactions_amortize_end_date;
+CREATE INDEX IF NOT EXISTS idx_transactions_amortize_range
+  ON transactions(amortize_end_date, transaction_date)
+  WHERE amortize_months IS NOT NULL;
+
+-- Category + date supports category-filtered date-range reports. It also covers
+-- plain category_id lookups, so it replaces the single-column index.
+DROP INDEX IF EXISTS idx_transactions_category_id;
+CREATE INDEX IF NOT EXISTS idx_transactions_category_date
+  ON transactions(category_id, transaction_date);
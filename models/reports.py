@@ -6,7 +6,7 @@ from typing import Dict, List
 from models.transaction import Transaction
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthTransactions:
     year: int
     month: int
@@ -14,7 +14,7 @@ class MonthTransactions:
     transactions: List[Transaction]
 
 
-@dataclass
+@dataclass(slots=True)
 class MonthSpendingSummary:
     year: int
     month: int
@@ -1,10 +1,19 @@
 from dataclasses import dataclass, field
 from datetime import date
+from functools import lru_cache
 from typing import Optional
 import hashlib
 
+from dateutil.relativedelta import relativedelta
 
-@dataclass
+
+@lru_cache(maxsize=4096)
+def _checksum(raw_data: str) -> str:
+    """Return the hex sha256 of a raw CSV row, memoized for repeated rows."""
+    return hashlib.sha256(raw_data.encode("utf-8")).hexdigest()
+
+
+@dataclass(slots=True)
 class Transaction:
     id: str  # checksum of raw transaction data
     account_id: int
@@ -55,9 +64,8 @@ class Transaction:
         an ID and the second will be silently dropped on insert. bulk_create logs a
         warning when it detects this within a single import batch.
         """
-        transaction_id = hashlib.sha256(raw_data.encode("utf-8")).hexdigest()
         return cls(
-            id=transaction_id,
+            id=_checksum(raw_data),
             account_id=account_id,
             transaction_date=transaction_date,
             post_date=post_date,
@@ -67,3 +75,16 @@ class Transaction:
             transaction_type=transaction_type,
             additional_metadata=additional_metadata,
         )
+
+    def set_amortization(self, months: int) -> None:
+        """Amortize this transaction over the given number of months.
+
+        Uses the month-boundary convention: every month the amortization
+        touches gets a full accrual, and amortize_end_date is the last day of
+        the final month (inclusive), not the anniversary date.
+        Example: Jan 15, 2024 over 12 months ends Dec 31, 2024.
+        """
+        self.amortize_months = months
+        self.amortize_end_date = self.transaction_date + relativedelta(
+            months=months - 1, day=31
+        )
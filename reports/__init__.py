@@ -3,9 +3,13 @@
 from reports.accrual_spending_summary import AccrualSpendingSummaryReport
 from reports.cash_spending_summary import CashSpendingSummaryReport
 from reports.month_transactions import MonthTransactionsReport
+from reports.period_spending_summary import PeriodSpendingSummaryReport
+from reports.period_transactions import PeriodTransactionsReport
 
 __all__ = [
     "AccrualSpendingSummaryReport",
     "CashSpendingSummaryReport",
     "MonthTransactionsReport",
+    "PeriodSpendingSummaryReport",
+    "PeriodTransactionsReport",
 ]
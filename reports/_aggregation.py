@@ -1,33 +1,32 @@
 """Shared aggregation helpers for spending summary reports."""
 
-from typing import Iterable
+from collections import defaultdict
+from typing import Iterable, Tuple
 
 from models.reports import MonthSpendingSummary
-from models.transaction import Transaction
 
 
-def summarize_transactions(
-    year: int, month: int, basis: str, transactions: Iterable[Transaction]
+def summarize_totals(
+    year: int,
+    month: int,
+    basis: str,
+    totals: Iterable[Tuple[str, int, int]],
 ) -> MonthSpendingSummary:
-    """Aggregate a list of transactions into a MonthSpendingSummary.
+    """Build a MonthSpendingSummary from pre-summed (type, category_id, total) rows.
 
-    Uses category_id=0 for uncategorized expenses.
+    Rows must already use category_id=0 for uncategorized expenses (the
+    repository totals queries project COALESCE(category_id, 0)).
     """
     income_total = 0
     expense_total = 0
-    expenses_by_category: dict[int, int] = {}
-
-    for transaction in transactions:
-        if transaction.transaction_type == "income":
-            income_total += transaction.amount
-        elif transaction.transaction_type == "expense":
-            expense_total += transaction.amount
-            category_id = (
-                transaction.category_id if transaction.category_id is not None else 0
-            )
-            expenses_by_category[category_id] = (
-                expenses_by_category.get(category_id, 0) + transaction.amount
-            )
+    expenses_by_category: defaultdict[int, int] = defaultdict(int)
+
+    for transaction_type, category_id, total in totals:
+        if transaction_type == "income":
+            income_total += total
+        elif transaction_type == "expense":
+            expense_total += total
+            expenses_by_category[category_id] += total
 
     return MonthSpendingSummary(
         year=year,
@@ -36,5 +35,18 @@ def summarize_transactions(
         income_total=income_total,
         expense_total=expense_total,
         net=income_total - expense_total,
-        expenses_by_category=expenses_by_category,
+        expenses_by_category=dict(expenses_by_category),
+    )
+
+
+def empty_summary(year: int, month: int, basis: str) -> MonthSpendingSummary:
+    """Return the all-zero MonthSpendingSummary for a month with no transactions."""
+    return MonthSpendingSummary(
+        year=year,
+        month=month,
+        basis=basis,
+        income_total=0,
+        expense_total=0,
+        net=0,
+        expenses_by_category={},
     )
@@ -3,8 +3,7 @@
 from typing import List, Optional
 
 from models.reports import MonthSpendingSummary
-from reports._aggregation import summarize_transactions
-from reports.month_transactions import MonthTransactionsReport
+from reports.period_spending_summary import PeriodSpendingSummaryReport
 
 
 class CashSpendingSummaryReport:
@@ -19,7 +18,7 @@ class CashSpendingSummaryReport:
         month: int,
         category_ids: Optional[List[int]] = None,
     ) -> MonthSpendingSummary:
-        month_txns = MonthTransactionsReport(self.db_manager).run(
-            year, month, basis="cash", category_ids=category_ids
-        )
-        return summarize_transactions(year, month, "cash", month_txns.transactions)
+        # A single month is a one-month period; both share one summing path
+        return PeriodSpendingSummaryReport(self.db_manager).run(
+            year, month, year, month, basis="cash", category_ids=category_ids
+        )[0]
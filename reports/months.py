@@ -0,0 +1,16 @@
+"""Month-range iteration shared by the period reports and their callers."""
+
+from typing import Iterator, Tuple
+
+
+def iter_months(
+    start_year: int, start_month: int, end_year: int, end_month: int
+) -> Iterator[Tuple[int, int]]:
+    """Yield (year, month) for each month from start through end, inclusive.
+
+    Walks a continuous month index (year * 12 + month - 1), so there is no
+    year-rollover branch. Yields nothing if the end is before the start.
+    """
+    for index in range(start_year * 12 + start_month - 1, end_year * 12 + end_month):
+        year, month0 = divmod(index, 12)
+        yield year, month0 + 1
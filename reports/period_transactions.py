@@ -0,0 +1,58 @@
+"""Period transactions report."""
+
+from typing import List, Optional
+
+from models.reports import MonthTransactions
+from reports.months import iter_months
+from repositories.transactions import TransactionRepository
+
+
+class PeriodTransactionsReport:
+    """Return the transactions for each month of a range on cash or accrual basis.
+
+    Same per-month results as running MonthTransactionsReport once per month,
+    but the whole range is fetched with one query and bucketed by month.
+    """
+
+    def __init__(self, db_manager):
+        self.db_manager = db_manager
+
+    def run(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        basis: str,
+        category_ids: Optional[List[int]] = None,
+    ) -> List[MonthTransactions]:
+        repo = TransactionRepository(self.db_manager)
+
+        if basis == "cash":
+            by_month = repo.get_transactions_by_months(
+                start_year,
+                start_month,
+                end_year,
+                end_month,
+                exclude_amortized=True,
+                category_ids=category_ids,
+            )
+        elif basis == "accrual":
+            by_month = repo.get_accrued_transactions_by_months(
+                start_year,
+                start_month,
+                end_year,
+                end_month,
+                category_ids=category_ids,
+            )
+        else:
+            raise ValueError(f"basis must be 'cash' or 'accrual', got {basis!r}")
+
+        return [
+            MonthTransactions(
+                year=year, month=month, basis=basis, transactions=transactions
+            )
+            for (year, month), transactions in zip(
+                iter_months(start_year, start_month, end_year, end_month), by_month
+            )
+        ]
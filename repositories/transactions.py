@@ -1,8 +1,10 @@
 """Transaction repository for database operations."""
 
+import calendar
 import json
 import logging
-from typing import List, Optional
+import sqlite3
+from typing import Dict, List, Optional, Tuple
 from datetime import date
 from models.transaction import Transaction
 
@@ -19,12 +21,180 @@ _TRANSACTION_INSERT_FIELDS = """id, account_id, data_import_id, transaction_date
     amount, transaction_type, additional_metadata, amortize_months, amortize_end_date,
     import_reviewed"""
 
+_TRANSACTION_INSERT_COLUMN_COUNT = len(_TRANSACTION_INSERT_FIELDS.split(","))
+
 # Automatically generate placeholders from field count
 _TRANSACTION_INSERT_PLACEHOLDERS = (
-    f"({', '.join(['?'] * len(_TRANSACTION_INSERT_FIELDS.split(',')))})"
+    f"({', '.join(['?'] * _TRANSACTION_INSERT_COLUMN_COUNT)})"
+)
+
+
+# Upper bound on rows per multi-row statement in bulk_create and batch_update.
+# The effective chunk is further limited by the connection's bound-parameter limit.
+_BULK_INSERT_MAX_ROWS = 500
+
+
+def _month_index(year: int, month: int) -> int:
+    """Return a month's position on a continuous month scale (year * 12 + month - 1)."""
+    return year * 12 + month - 1
+
+
+def _month_range_bounds(
+    start_year: int, start_month: int, end_year: int, end_month: int
+) -> Tuple[str, str]:
+    """Return the ISO first day of the start month and last day of the end month.
+
+    Both bounds are inclusive, so callers compare with >= and <=. Using the end
+    month's last day rather than the first day of the following month keeps
+    December 9999 representable.
+    """
+    last_day = calendar.monthrange(end_year, end_month)[1]
+    return (
+        date(start_year, start_month, 1).isoformat(),
+        date(end_year, end_month, last_day).isoformat(),
+    )
+
+
+def _add_accrued_row(
+    sums: List[dict],
+    first_index: int,
+    last_index: int,
+    txn_index: int,
+    end_index: int,
+    accrued_amount: int,
+    key: tuple,
+) -> None:
+    """Add one amortized transaction's accrued amount to each month it covers.
+
+    Uses the same accrual span as get_accrued_transactions_by_months: from the
+    transaction's month through its end date's month, clipped to the range.
+    """
+    for index in range(max(first_index, txn_index), min(last_index, end_index) + 1):
+        month_sums = sums[index - first_index]
+        month_sums[key] = month_sums.get(key, 0) + accrued_amount
+
+
+def _sums_to_totals(month_sums: dict) -> List[tuple]:
+    """Flatten {(transaction_type, category_id): total} into totals rows."""
+    return [
+        (transaction_type, category_id, total)
+        for (transaction_type, category_id), total in month_sums.items()
+    ]
+
+
+def _month_index_sql(column: str) -> str:
+    """Return a SQL expression computing _month_index for an ISO date column."""
+    return (
+        f"CAST(substr({column}, 1, 4) AS INTEGER) * 12"
+        f" + CAST(substr({column}, 6, 2) AS INTEGER) - 1"
+    )
+
+
+# Transactions dated within [range_start, range_end]
+_CASH_RANGE_WHERE = "transaction_date >= ? AND transaction_date <= ?"
+
+# Amortized transactions whose accrual span overlaps [range_start, range_end].
+# Parameters are (range_end, range_start).
+_ACCRUED_RANGE_WHERE = (
+    "transaction_date <= ? AND amortize_end_date >= ? AND amortize_months IS NOT NULL"
 )
 
 
+def _filter_clause(
+    account_id: Optional[int], category_ids: Optional[List[int]]
+) -> Tuple[str, list]:
+    """Build the " AND ..." SQL suffix and parameters for the optional filters."""
+    clause = ""
+    params: list = []
+
+    if account_id is not None:
+        clause += " AND account_id = ?"
+        params.append(account_id)
+
+    if category_ids is not None and len(category_ids) > 0:
+        placeholders = ", ".join(["?"] * len(category_ids))
+        clause += f" AND category_id IN ({placeholders})"
+        params.extend(category_ids)
+
+    return clause, params
+
+
+# Totals queries return rows of (is_accrued, month_index, end_index, amount,
+# amortize_months, transaction_type, category_id) so the cash and accrued
+# selects can be run alone or combined with UNION ALL.
+
+
+def _cash_totals_query(
+    range_start: str,
+    range_end: str,
+    filters: str,
+    filter_params: list,
+    exclude_amortized: bool,
+) -> Tuple[str, list]:
+    """Build the select summing amounts per month, type, and category in SQL."""
+    amortized = " AND amortize_months IS NULL" if exclude_amortized else ""
+    query = f"""
+        SELECT 0, {_month_index_sql("transaction_date")}, NULL, SUM(amount), NULL,
+               transaction_type, COALESCE(category_id, 0)
+        FROM transactions
+        WHERE {_CASH_RANGE_WHERE}{amortized}{filters}
+        GROUP BY 2, 6, 7
+    """
+    return query, [range_start, range_end, *filter_params]
+
+
+def _accrued_totals_query(
+    range_start: str, range_end: str, filters: str, filter_params: list
+) -> Tuple[str, list]:
+    """Build the select returning one row per amortized transaction in range.
+
+    Accrued amounts are rounded per transaction in Python, so these rows are
+    not summed in SQL.
+    """
+    query = f"""
+        SELECT 1, {_month_index_sql("transaction_date")},
+               {_month_index_sql("amortize_end_date")}, amount, amortize_months,
+               transaction_type, COALESCE(category_id, 0)
+        FROM transactions
+        WHERE {_ACCRUED_RANGE_WHERE}{filters}
+    """
+    return query, [range_end, range_start, *filter_params]
+
+
+def _bucket_totals_rows(
+    rows, first_index: int, last_index: int
+) -> Tuple[List[List[tuple]], List[List[tuple]]]:
+    """Split totals query rows into (cash, accrual) lists with one list per month."""
+    cash: List[List[tuple]] = [[] for _ in range(last_index - first_index + 1)]
+    sums: List[dict] = [{} for _ in range(last_index - first_index + 1)]
+
+    for (
+        is_accrued,
+        month_index,
+        end_index,
+        amount,
+        months,
+        transaction_type,
+        category_id,
+    ) in rows:
+        if is_accrued:
+            _add_accrued_row(
+                sums,
+                first_index,
+                last_index,
+                month_index,
+                end_index,
+                round(amount / months),
+                (transaction_type, category_id),
+            )
+        else:
+            cash[month_index - first_index].append(
+                (transaction_type, category_id, amount)
+            )
+
+    return cash, [_sums_to_totals(month_sums) for month_sums in sums]
+
+
 class TransactionRepository:
     """Repository for managing transactions."""
 
@@ -162,24 +332,40 @@ class TransactionRepository:
                 for t in transactions
             ]
 
-            # Execute bulk insert
-            cursor = conn.executemany(
-                f"""
-                INSERT OR IGNORE INTO transactions ({_TRANSACTION_INSERT_FIELDS})
-                VALUES {_TRANSACTION_INSERT_PLACEHOLDERS}
-                """,
-                data,
+            # Insert in multi-row chunks, staying under the bound-parameter limit
+            chunk_size = min(
+                _BULK_INSERT_MAX_ROWS,
+                conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+                // _TRANSACTION_INSERT_COLUMN_COUNT,
             )
+            inserted = 0
+            for start in range(0, len(data), chunk_size):
+                chunk = data[start : start + chunk_size]
+                values = ", ".join([_TRANSACTION_INSERT_PLACEHOLDERS] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    INSERT OR IGNORE INTO transactions ({_TRANSACTION_INSERT_FIELDS})
+                    VALUES {values}
+                    """,
+                    [value for row in chunk for value in row],
+                )
+                # rowcount is scoped to this statement, so prior inserts on the
+                # connection don't inflate the total
+                inserted += cursor.rowcount
             conn.commit()
 
             # Return count of inserted rows
-            return cursor.rowcount
+            return inserted
 
     def batch_update(
         self, transactions: List[Transaction], field_names: List[str]
     ) -> int:
         """Update specified fields for multiple transactions.
 
+        Rows are applied with chunked UPDATE ... FROM (VALUES ...) statements
+        rather than one UPDATE per transaction. If the same ID appears more than
+        once, its last entry wins.
+
         Args:
             transactions: List of Transaction objects to update.
             field_names: List of field names to update. Supported fields:
@@ -213,37 +399,67 @@ class TransactionRepository:
         if invalid_fields:
             raise ValueError(f"Unsupported field names: {invalid_fields}")
 
-        # Build SET clause dynamically
-        set_clause = ", ".join([f"{field} = ?" for field in field_names])
+        # Prepare update data - transaction ID followed by field values. Later
+        # entries for the same ID win, as they would with one UPDATE per row.
+        data: dict[str, tuple] = {}
+        for t in transactions:
+            row_data = [t.id]
+            for field in field_names:
+                value = getattr(t, field)
+                # Handle date serialization
+                if field == "amortize_end_date" and value is not None:
+                    value = value.isoformat()
+                row_data.append(value)
+            data[t.id] = tuple(row_data)
 
         with self.db_manager.connect() as conn:
-            # Prepare update data - field values followed by transaction ID
-            data = []
-            for t in transactions:
-                row_data = []
-                for field in field_names:
-                    value = getattr(t, field)
-                    # Handle date serialization
-                    if field == "amortize_end_date" and value is not None:
-                        value = value.isoformat()
-                    row_data.append(value)
-                # Add transaction ID at the end for WHERE clause
-                row_data.append(t.id)
-                data.append(tuple(row_data))
-
-            # Execute batch update
-            cursor = conn.executemany(
-                f"""
-                UPDATE transactions
-                SET {set_clause}
-                WHERE id = ?
-                """,
-                data,
+            if len(data) == 1:
+                # Single row: plain UPDATE, no VALUES join needed
+                (row_data,) = data.values()
+                set_clause = ", ".join([f"{field} = ?" for field in field_names])
+                cursor = conn.execute(
+                    f"""
+                    UPDATE transactions
+                    SET {set_clause}
+                    WHERE id = ?
+                    """,
+                    (*row_data[1:], row_data[0]),
+                )
+                conn.commit()
+                return cursor.rowcount
+
+            # Join each chunk of (id, values...) rows against transactions in
+            # one UPDATE ... FROM statement
+            column_count = len(field_names) + 1
+            row_placeholders = f"({', '.join(['?'] * column_count)})"
+            # VALUES columns are named column1 (id), column2, ... by SQLite
+            set_clause = ", ".join(
+                [f"{field} = v.column{i + 2}" for i, field in enumerate(field_names)]
             )
+            rows = list(data.values())
+            chunk_size = min(
+                _BULK_INSERT_MAX_ROWS,
+                conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER) // column_count,
+            )
+
+            updated = 0
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                values = ", ".join([row_placeholders] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    UPDATE transactions
+                    SET {set_clause}
+                    FROM (VALUES {values}) AS v
+                    WHERE transactions.id = v.column1
+                    """,
+                    [value for row in chunk for value in row],
+                )
+                updated += cursor.rowcount
             conn.commit()
 
             # Return count of updated rows
-            return cursor.rowcount
+            return updated
 
     def update(self, transaction: Transaction, field_names: List[str]) -> bool:
         """Update specified fields for a single transaction.
@@ -286,6 +502,22 @@ class TransactionRepository:
 
             return [self._row_to_transaction(row) for row in rows]
 
+    def count_by_account(self, account_id: int) -> int:
+        """Count all transactions for a specific account.
+
+        Args:
+            account_id: The account ID to filter by.
+
+        Returns:
+            Number of transactions belonging to the account.
+        """
+        with self.db_manager.connect() as conn:
+            cursor = conn.execute(
+                "SELECT COUNT(*) FROM transactions WHERE account_id = ?",
+                (account_id,),
+            )
+            return cursor.fetchone()[0]
+
     def find_by_data_import_id(self, data_import_id: int) -> List[Transaction]:
         """Return all transactions belonging to a given data import.
 
@@ -429,6 +661,37 @@ class TransactionRepository:
                 return self._row_to_transaction(row)
             return None
 
+    def find_many(self, transaction_ids: List[str]) -> Dict[str, Transaction]:
+        """Get several transactions by ID.
+
+        Args:
+            transaction_ids: The transaction checksum IDs.
+
+        Returns:
+            Dict mapping each found ID to its Transaction. IDs that don't
+            exist are absent from the result.
+        """
+        ids = list(dict.fromkeys(transaction_ids))
+        found: Dict[str, Transaction] = {}
+        with self.db_manager.connect() as conn:
+            # Chunk the IN list to stay under the bound-parameter limit
+            chunk_size = conn.getlimit(sqlite3.SQLITE_LIMIT_VARIABLE_NUMBER)
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start : start + chunk_size]
+                placeholders = ", ".join(["?"] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT {_TRANSACTION_SELECT_FIELDS}
+                    FROM transactions
+                    WHERE id IN ({placeholders})
+                    """,
+                    chunk,
+                )
+                for row in cursor.fetchall():
+                    transaction = self._row_to_transaction(row)
+                    found[transaction.id] = transaction
+        return found
+
     def get_transactions_by_date_range(
         self,
         start_date: str,
@@ -516,6 +779,110 @@ class TransactionRepository:
             category_ids=category_ids,
         )
 
+    def get_transactions_by_months(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        *,
+        account_id: Optional[int] = None,
+        exclude_amortized: bool = False,
+        category_ids: Optional[List[int]] = None,
+    ) -> List[List[Transaction]]:
+        """Get transactions for a range of months with a single query.
+
+        Equivalent to calling get_transactions_by_month for each month in the
+        range, but fetches the whole range at once and buckets it by month.
+
+        Args:
+            start_year: Year of the first month.
+            start_month: First month (1-12).
+            end_year: Year of the last month.
+            end_month: Last month (1-12), inclusive.
+            account_id: Optional account ID to filter by.
+            exclude_amortized: If True, exclude transactions with amortize_months set.
+            category_ids: Optional list of category IDs to filter by.
+
+        Returns:
+            One list per month, from the start month through the end month
+            (empty if the end is before the start). Each list is ordered by
+            date (newest first).
+        """
+        first_index = _month_index(start_year, start_month)
+        month_count = _month_index(end_year, end_month) - first_index + 1
+        if month_count <= 0:
+            return []
+        buckets: List[List[Transaction]] = [[] for _ in range(month_count)]
+
+        range_start, range_end = _month_range_bounds(
+            start_year, start_month, end_year, end_month
+        )
+        transactions = self.get_transactions_by_date_range(
+            range_start,
+            range_end,
+            account_id=account_id,
+            exclude_amortized=exclude_amortized,
+            category_ids=category_ids,
+        )
+        for transaction in transactions:
+            txn_date = transaction.transaction_date
+            buckets[_month_index(txn_date.year, txn_date.month) - first_index].append(
+                transaction
+            )
+
+        return buckets
+
+    def get_totals_by_months(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        *,
+        account_id: Optional[int] = None,
+        exclude_amortized: bool = False,
+        category_ids: Optional[List[int]] = None,
+    ) -> List[List[tuple]]:
+        """Get summed amounts per type and category for a range of months.
+
+        Aggregates in SQL, so no Transaction objects are built. Takes the same
+        filters as get_transactions_by_months.
+
+        Args:
+            start_year: Year of the first month.
+            start_month: First month (1-12).
+            end_year: Year of the last month.
+            end_month: Last month (1-12), inclusive.
+            account_id: Optional account ID to filter by.
+            exclude_amortized: If True, exclude transactions with amortize_months set.
+            category_ids: Optional list of category IDs to filter by.
+
+        Returns:
+            One list per month, from the start month through the end month
+            (empty if the end is before the start). Each list holds
+            (transaction_type, category_id, total) tuples, with category_id 0
+            for uncategorized transactions.
+        """
+        first_index = _month_index(start_year, start_month)
+        last_index = _month_index(end_year, end_month)
+        if last_index < first_index:
+            return []
+
+        range_start, range_end = _month_range_bounds(
+            start_year, start_month, end_year, end_month
+        )
+        filters, filter_params = _filter_clause(account_id, category_ids)
+        query, params = _cash_totals_query(
+            range_start, range_end, filters, filter_params, exclude_amortized
+        )
+
+        with self.db_manager.connect() as conn:
+            rows = conn.execute(query, params).fetchall()
+
+        cash, _ = _bucket_totals_rows(rows, first_index, last_index)
+        return cash
+
     def get_accrued_transactions_by_month(
         self,
         year: int,
@@ -543,69 +910,211 @@ class TransactionRepository:
             - amount set to original_amount / amortize_months (rounded to 2 decimals)
             - accrued flag set to True
         """
-        import calendar
+        return self.get_accrued_transactions_by_months(
+            year,
+            month,
+            year,
+            month,
+            account_id=account_id,
+            category_ids=category_ids,
+        )[0]
 
-        # Calculate start and end dates for the month
-        start_date = date(year, month, 1)
-        last_day = calendar.monthrange(year, month)[1]
-        end_date = date(year, month, last_day)
+    def get_accrued_transactions_by_months(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        *,
+        account_id: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+    ) -> List[List[Transaction]]:
+        """Get accrued transactions for a range of months with a single query.
 
-        # Build query to find transactions that accrue in this month
+        Equivalent to calling get_accrued_transactions_by_month for each month
+        in the range. Amortized transactions overlapping the range are fetched
+        once and expanded into one virtual accrued Transaction per month they
+        accrue in.
+
+        Args:
+            start_year: Year of the first month.
+            start_month: First month (1-12).
+            end_year: Year of the last month.
+            end_month: Last month (1-12), inclusive.
+            account_id: Optional account ID to filter by.
+            category_ids: Optional list of category IDs to filter by.
+
+        Returns:
+            One list per month, from the start month through the end month
+            (empty if the end is before the start).
+        """
+        first_index = _month_index(start_year, start_month)
+        last_index = _month_index(end_year, end_month)
+        if last_index < first_index:
+            return []
+        buckets: List[List[Transaction]] = [
+            [] for _ in range(last_index - first_index + 1)
+        ]
+
+        range_start, range_end = _month_range_bounds(
+            start_year, start_month, end_year, end_month
+        )
+
+        # Find transactions that accrue in any month of the range
+        filters, filter_params = _filter_clause(account_id, category_ids)
         query = f"""
             SELECT {_TRANSACTION_SELECT_FIELDS}
             FROM transactions
-            WHERE transaction_date <= ?
-              AND amortize_end_date >= ?
-              AND amortize_months IS NOT NULL
+            WHERE {_ACCRUED_RANGE_WHERE}{filters}
+            ORDER BY transaction_date DESC, id
         """
+        params = [range_end, range_start, *filter_params]
 
-        params = [end_date.isoformat(), start_date.isoformat()]
+        with self.db_manager.connect() as conn:
+            cursor = conn.execute(query, params)
+            rows = cursor.fetchall()
 
-        if account_id is not None:
-            query += " AND account_id = ?"
-            params.append(account_id)
+        for row in rows:
+            original = self._row_to_transaction(row)
 
-        if category_ids is not None and len(category_ids) > 0:
-            placeholders = ", ".join(["?"] * len(category_ids))
-            query += f" AND category_id IN ({placeholders})"
-            params.extend(category_ids)
+            # A transaction accrues from its own month through its end date's month
+            txn_date = original.transaction_date
+            end_date = original.amortize_end_date
+            first = max(first_index, _month_index(txn_date.year, txn_date.month))
+            last = min(last_index, _month_index(end_date.year, end_date.month))
 
-        query += " ORDER BY transaction_date DESC, id"
+            # Calculate accrued amount in cents, rounded to nearest cent. It is
+            # the same for every month, so compute it once per transaction.
+            accrued_amount = round(original.amount / original.amortize_months)
+
+            for index in range(first, last + 1):
+                month_start = date(index // 12, index % 12 + 1, 1)
+                buckets[index - first_index].append(
+                    self._to_accrued(original, month_start, accrued_amount)
+                )
+
+        return buckets
+
+    def get_accrued_totals_by_months(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        *,
+        account_id: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+    ) -> List[List[tuple]]:
+        """Get summed accrued amounts per type and category for a range of months.
+
+        Totals match summing get_accrued_transactions_by_months, but only the
+        columns the sums need are read and no Transaction objects are built.
+
+        Args:
+            start_year: Year of the first month.
+            start_month: First month (1-12).
+            end_year: Year of the last month.
+            end_month: Last month (1-12), inclusive.
+            account_id: Optional account ID to filter by.
+            category_ids: Optional list of category IDs to filter by.
+
+        Returns:
+            One list per month, from the start month through the end month
+            (empty if the end is before the start). Each list holds
+            (transaction_type, category_id, total) tuples, with category_id 0
+            for uncategorized transactions.
+        """
+        first_index = _month_index(start_year, start_month)
+        last_index = _month_index(end_year, end_month)
+        if last_index < first_index:
+            return []
+
+        range_start, range_end = _month_range_bounds(
+            start_year, start_month, end_year, end_month
+        )
+        filters, filter_params = _filter_clause(account_id, category_ids)
+        query, params = _accrued_totals_query(
+            range_start, range_end, filters, filter_params
+        )
 
         with self.db_manager.connect() as conn:
-            cursor = conn.execute(query, params)
-            rows = cursor.fetchall()
+            rows = conn.execute(query, params).fetchall()
 
-            # Convert rows to Transaction objects and transform to accrued versions
-            accrued_transactions = []
-            for row in rows:
-                original = self._row_to_transaction(row)
-
-                # Calculate accrued amount in cents, rounded to nearest cent
-                accrued_amount = round(original.amount / original.amortize_months)
-
-                # Create new Transaction with accrued values
-                accrued_txn = Transaction(
-                    id=original.id,
-                    account_id=original.account_id,
-                    transaction_date=start_date,  # Set to start of target month
-                    post_date=original.post_date,
-                    description=original.description,
-                    bank_category=original.bank_category,
-                    amount=accrued_amount,
-                    transaction_type=original.transaction_type,
-                    additional_metadata=original.additional_metadata,
-                    data_import_id=original.data_import_id,
-                    category_id=original.category_id,
-                    auto_category_id=original.auto_category_id,
-                    amortize_months=original.amortize_months,
-                    amortize_end_date=original.amortize_end_date,
-                    accrued=True,  # Mark as accrued transaction
-                )
+        _, accrual = _bucket_totals_rows(rows, first_index, last_index)
+        return accrual
 
-                accrued_transactions.append(accrued_txn)
+    def get_cash_and_accrued_totals_by_months(
+        self,
+        start_year: int,
+        start_month: int,
+        end_year: int,
+        end_month: int,
+        *,
+        account_id: Optional[int] = None,
+        category_ids: Optional[List[int]] = None,
+    ) -> Tuple[List[List[tuple]], List[List[tuple]]]:
+        """Get cash-basis and accrual-basis totals for a range of months at once.
+
+        Equivalent to get_totals_by_months(exclude_amortized=True) plus
+        get_accrued_totals_by_months, but both come from a single statement on
+        one connection, so the two bases read the same snapshot.
 
-            return accrued_transactions
+        Args:
+            start_year: Year of the first month.
+            start_month: First month (1-12).
+            end_year: Year of the last month.
+            end_month: Last month (1-12), inclusive.
+            account_id: Optional account ID to filter by.
+            category_ids: Optional list of category IDs to filter by.
+
+        Returns:
+            (cash, accrual) lists shaped like get_totals_by_months' result.
+        """
+        first_index = _month_index(start_year, start_month)
+        last_index = _month_index(end_year, end_month)
+        if last_index < first_index:
+            return [], []
+
+        range_start, range_end = _month_range_bounds(
+            start_year, start_month, end_year, end_month
+        )
+        filters, filter_params = _filter_clause(account_id, category_ids)
+        cash_query, cash_params = _cash_totals_query(
+            range_start, range_end, filters, filter_params, exclude_amortized=True
+        )
+        accrued_query, accrued_params = _accrued_totals_query(
+            range_start, range_end, filters, filter_params
+        )
+
+        with self.db_manager.connect() as conn:
+            rows = conn.execute(
+                f"{cash_query} UNION ALL {accrued_query}",
+                cash_params + accrued_params,
+            ).fetchall()
+
+        return _bucket_totals_rows(rows, first_index, last_index)
+
+    def _to_accrued(
+        self, original: Transaction, month_start: date, accrued_amount: int
+    ) -> Transaction:
+        """Build the virtual accrued Transaction for one month of an amortization."""
+        return Transaction(
+            id=original.id,
+            account_id=original.account_id,
+            transaction_date=month_start,  # Set to start of target month
+            post_date=original.post_date,
+            description=original.description,
+            bank_category=original.bank_category,
+            amount=accrued_amount,
+            transaction_type=original.transaction_type,
+            additional_metadata=original.additional_metadata,
+            data_import_id=original.data_import_id,
+            category_id=original.category_id,
+            auto_category_id=original.auto_category_id,
+            amortize_months=original.amortize_months,
+            amortize_end_date=original.amortize_end_date,
+            accrued=True,  # Mark as accrued transaction
+        )
 
     def _row_to_transaction(self, row: tuple) -> Transaction:
         """Convert a database row to a Transaction object."""
@@ -5,7 +5,6 @@ import shutil
 from datetime import datetime
 from pathlib import Path
 
-from dateutil.relativedelta import relativedelta
 
 from config import Config
 from ingestion import get_ingestion_module
@@ -226,12 +225,7 @@ class IngestionService:
                             skipped_count += 1
                             continue
                         if transaction.amortize_months != amortize_months:
-                            amortize_end_date = (
-                                transaction.transaction_date
-                                + relativedelta(months=amortize_months - 1, day=31)
-                            )
-                            transaction.amortize_months = amortize_months
-                            transaction.amortize_end_date = amortize_end_date
+                            transaction.set_amortization(amortize_months)
                             if transaction_id not in transactions_to_update:
                                 transactions_to_update[transaction_id] = (
                                     transaction,
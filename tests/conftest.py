@@ -66,8 +66,25 @@ def test_config(tmp_path):
     )
 
 
+@pytest.fixture(scope="session")
+def migrated_template_db():
+    """Create an in-memory SQLite database with all migrations applied.
+
+    Migrations run once per session; per-test databases are copied from this
+    template instead of re-running every migration script. The connection
+    stays open for the whole session and must not be written to by tests.
+
+    Yields:
+        sqlite3.Connection: Connection to the migrated template database.
+    """
+    conn = sqlite3.connect(":memory:")
+    run_migrations(conn, get_migrations_dir())
+    yield conn
+    conn.close()
+
+
 @pytest.fixture
-def db_manager_with_schema(test_db):
+def db_manager_with_schema(test_db, migrated_template_db):
     """Create a DatabaseManager with schema already set up.
 
     This fixture provides a DatabaseManager that uses an in-memory database
@@ -75,13 +92,13 @@ def db_manager_with_schema(test_db):
 
     Args:
         test_db: In-memory database connection fixture.
+        migrated_template_db: Session-wide migrated database to copy from.
 
     Returns:
         DatabaseManager: Database manager with schema ready.
     """
-    # Run migrations to set up schema
-    migrations_dir = get_migrations_dir()
-    run_migrations(test_db, migrations_dir)
+    # Copy the migrated schema into this test's fresh database
+    migrated_template_db.backup(test_db)
 
     # Create a custom DatabaseManager that uses our in-memory connection
     class TestDatabaseManager:
@@ -137,3 +154,19 @@ def services(test_config, db_manager_with_schema):
             self.budgets = BudgetRepository(db_manager_with_schema)
 
     return _TestServices()
+
+
+@pytest.fixture
+def account(services):
+    """Create the account that transaction tests attach their rows to.
+
+    Each test gets its own copy of the database, so the seed rows are
+    created per test rather than shared across the session.
+    """
+    return services.accounts.create("test_account", "bofa", "Test Account")
+
+
+@pytest.fixture
+def data_import(services, account):
+    """Create a data import for the shared test account."""
+    return services.data_imports.create(account.id, "test.csv.gz")
@@ -0,0 +1,21 @@
+"""Tests for migration 013 (transactions account/date index)."""
+
+
+def test_find_by_account_query_uses_account_date_index(db_manager_with_schema):
+    with db_manager_with_schema.connect() as conn:
+        plan = [
+            row[3]
+            for row in conn.execute(
+                """
+                EXPLAIN QUERY PLAN
+                SELECT id FROM transactions
+                WHERE account_id = ?
+                ORDER BY transaction_date DESC, id
+                """,
+                (1,),
+            )
+        ]
+
+    assert any("USING INDEX idx_transactions_account_date" in step for step in plan)
+    # Only the id tie-break is sorted; the date ordering comes from the index.
+    assert "USE TEMP B-TREE FOR ORDER BY" not in plan
@@ -0,0 +1,44 @@
+"""Tests for migration 014 (accrual and category/date indexes on transactions)."""
+
+from repositories.transactions import (
+    _accrued_totals_query,
+    _cash_totals_query,
+    _filter_clause,
+)
+
+
+def _plan(conn, sql, params):
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def test_accrual_query_uses_partial_amortize_index(db_manager_with_schema):
+    query, params = _accrued_totals_query("2024-07-01", "2024-07-31", "", [])
+    with db_manager_with_schema.connect() as conn:
+        plan = _plan(conn, query, params)
+
+    assert any("USING INDEX idx_transactions_amortize_range" in step for step in plan)
+
+
+def test_category_filtered_range_uses_category_date_index(db_manager_with_schema):
+    filters, filter_params = _filter_clause(None, [1, 2])
+    query, params = _cash_totals_query(
+        "2024-07-01", "2024-07-31", filters, filter_params, exclude_amortized=True
+    )
+    with db_manager_with_schema.connect() as conn:
+        plan = _plan(conn, query, params)
+
+    assert any("USING INDEX idx_transactions_category_date" in step for step in plan)
+
+
+def test_replaced_single_column_indexes_are_dropped(db_manager_with_schema):
+    with db_manager_with_schema.connect() as conn:
+        names = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'index'"
+                " AND tbl_name = 'transactions'"
+            )
+        }
+
+    assert "idx_transactions_amortize_end_date" not in names
+    assert "idx_transactions_category_id" not in names
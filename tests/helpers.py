@@ -1,7 +1,11 @@
 """Helper utilities for tests."""
 
+from datetime import date
 from pathlib import Path
 import sqlite3
+import uuid
+
+from models.transaction import Transaction
 
 
 def run_migrations(conn: sqlite3.Connection, migrations_dir: Path) -> None:
@@ -22,3 +26,51 @@ def run_migrations(conn: sqlite3.Connection, migrations_dir: Path) -> None:
         conn.executescript(sql)
 
     conn.commit()
+
+
+def make_transaction(
+    account_id: int,
+    transaction_date: date,
+    description: str,
+    amount: int,
+    **fields,
+) -> Transaction:
+    """Build a Transaction with a random ID, skipping the raw-data checksum.
+
+    For tests where the ID only needs to be unique; tests that rely on
+    checksum-derived IDs (duplicate detection) should keep using
+    Transaction.create_with_checksum.
+
+    Args:
+        account_id: Account the transaction belongs to.
+        transaction_date: Date of the transaction.
+        description: Transaction description.
+        amount: Amount in cents.
+        **fields: Any other Transaction fields to override. post_date and
+            bank_category default to None and transaction_type to "expense".
+    """
+    fields.setdefault("post_date", None)
+    fields.setdefault("bank_category", None)
+    fields.setdefault("transaction_type", "expense")
+    return Transaction(
+        id=uuid.uuid4().hex,
+        account_id=account_id,
+        transaction_date=transaction_date,
+        description=description,
+        amount=amount,
+        **fields,
+    )
+
+
+def persist(services, *transactions: Transaction) -> list[Transaction]:
+    """Insert test transactions with a single bulk_create call.
+
+    Args:
+        services: The services fixture.
+        *transactions: Transactions to insert.
+
+    Returns:
+        The transactions, in the order given.
+    """
+    services.transactions.bulk_create(list(transactions))
+    return list(transactions)
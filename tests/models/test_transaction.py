@@ -3,6 +3,7 @@
 import hashlib
 from datetime import date
 
+import pytest
 
 from models.transaction import Transaction
 
@@ -137,3 +138,55 @@ class TestCreateWithChecksum:
         )
         assert len(t.id) == 64
         assert t.id == hashlib.sha256(b"").hexdigest()
+
+
+class TestSetAmortization:
+    """Tests for Transaction.set_amortization()."""
+
+    def _txn(self, transaction_date):
+        return Transaction(
+            id="t",
+            account_id=1,
+            transaction_date=transaction_date,
+            post_date=None,
+            description="Subscription",
+            bank_category=None,
+            amount=12000,
+            transaction_type="expense",
+        )
+
+    def test_end_date_is_last_day_of_final_month(self):
+        t = self._txn(date(2024, 1, 15))
+        t.set_amortization(12)
+        assert t.amortize_months == 12
+        assert t.amortize_end_date == date(2024, 12, 31)
+
+    def test_single_month_ends_same_month(self):
+        t = self._txn(date(2024, 2, 10))
+        t.set_amortization(1)
+        assert t.amortize_end_date == date(2024, 2, 29)
+
+    def test_end_date_clamps_to_short_month(self):
+        t = self._txn(date(2024, 1, 31))
+        t.set_amortization(2)
+        assert t.amortize_end_date == date(2024, 2, 29)
+
+
+class TestSlots:
+    """Tests for Transaction's slots-based layout."""
+
+    def test_unknown_attribute_cannot_be_set(self):
+        t = Transaction(
+            id="t",
+            account_id=1,
+            transaction_date=date(2024, 1, 15),
+            post_date=None,
+            description="Coffee",
+            bank_category=None,
+            amount=500,
+            transaction_type="expense",
+        )
+
+        assert not hasattr(t, "__dict__")
+        with pytest.raises(AttributeError):
+            t.merchant = "typo for merchant_name"
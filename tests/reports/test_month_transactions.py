@@ -3,49 +3,36 @@
 from datetime import date
 
 import pytest
-from dateutil.relativedelta import relativedelta
 
-from models.transaction import Transaction
 from reports.month_transactions import MonthTransactionsReport
+from tests.helpers import make_transaction, persist
 
 
 class TestMonthTransactionsReport:
-    def test_single_month_cash_basis_excludes_amortized(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
+    def test_single_month_cash_basis_excludes_amortized(
+        self, services, account, data_import
+    ):
         category = services.categories.create("Food", "Food expenses")
 
-        regular = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Coffee,-5.00,1000.00",
+        regular = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category.id,
         )
-        regular.data_import_id = data_import.id
-        regular.category_id = category.id
-        services.transactions.create(regular)
 
-        amortized = Transaction.create_with_checksum(
-            raw_data="01/20/2024,Subscription,-120.00,995.00",
+        amortized = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 20),
-            post_date=None,
             description="Annual Subscription",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category.id,
         )
-        amortized.data_import_id = data_import.id
-        amortized.category_id = category.id
-        amortized.amortize_months = 12
-        amortized.amortize_end_date = amortized.transaction_date + relativedelta(
-            months=11, day=31
-        )
-        services.transactions.create(amortized)
+        amortized.set_amortization(12)
+        persist(services, regular, amortized)
 
         result = MonthTransactionsReport(services.db_manager).run(2024, 1, "cash")
 
@@ -55,28 +42,19 @@ class TestMonthTransactionsReport:
         assert len(result.transactions) == 1
         assert result.transactions[0].description == "Coffee"
 
-    def test_single_month_accrual_basis(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
+    def test_single_month_accrual_basis(self, services, account, data_import):
         category = services.categories.create("Food", "Food expenses")
 
-        amortized = Transaction.create_with_checksum(
-            raw_data="01/20/2024,Subscription,-120.00,995.00",
+        amortized = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 20),
-            post_date=None,
             description="Annual Subscription",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
-        )
-        amortized.data_import_id = data_import.id
-        amortized.category_id = category.id
-        amortized.amortize_months = 12
-        amortized.amortize_end_date = amortized.transaction_date + relativedelta(
-            months=11, day=31
+            data_import_id=data_import.id,
+            category_id=category.id,
         )
-        services.transactions.create(amortized)
+        amortized.set_amortization(12)
+        persist(services, amortized)
 
         result = MonthTransactionsReport(services.db_manager).run(2024, 1, "accrual")
 
@@ -86,23 +64,20 @@ class TestMonthTransactionsReport:
         assert result.transactions[0].amount == 1000
         assert result.transactions[0].accrued is True
 
-    def test_multi_month_via_caller_loop(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        for month in [1, 2, 3]:
-            t = Transaction.create_with_checksum(
-                raw_data=f"0{month}/15/2024,TX{month},-10.00,1000.00",
-                account_id=account.id,
-                transaction_date=date(2024, month, 15),
-                post_date=None,
-                description=f"Transaction {month}",
-                bank_category=None,
-                amount=1000,
-                transaction_type="expense",
-            )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+    def test_multi_month_via_caller_loop(self, services, account, data_import):
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=date(2024, month, 15),
+                    description=f"Transaction {month}",
+                    amount=1000,
+                    data_import_id=data_import.id,
+                )
+                for month in [1, 2, 3]
+            ),
+        )
 
         report = MonthTransactionsReport(services.db_manager)
         results = [report.run(2024, m, "cash") for m in [1, 2, 3]]
@@ -113,24 +88,21 @@ class TestMonthTransactionsReport:
             assert r.basis == "cash"
             assert len(r.transactions) == 1
 
-    def test_cross_year_via_caller_loop(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
+    def test_cross_year_via_caller_loop(self, services, account, data_import):
         dates = [date(2024, 11, 15), date(2024, 12, 15), date(2025, 1, 15)]
-        for txn_date in dates:
-            t = Transaction.create_with_checksum(
-                raw_data=f"{txn_date.isoformat()},TX,-10.00,1000.00",
-                account_id=account.id,
-                transaction_date=txn_date,
-                post_date=None,
-                description=f"Transaction {txn_date.month}",
-                bank_category=None,
-                amount=1000,
-                transaction_type="expense",
-            )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=txn_date,
+                    description=f"Transaction {txn_date.month}",
+                    amount=1000,
+                    data_import_id=data_import.id,
+                )
+                for txn_date in dates
+            ),
+        )
 
         report = MonthTransactionsReport(services.db_manager)
         nov = report.run(2024, 11, "cash")
@@ -140,55 +112,38 @@ class TestMonthTransactionsReport:
         assert len(dec.transactions) == 1
         assert len(jan.transactions) == 1
 
-    def test_category_filter(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
+    def test_category_filter(self, services, account, data_import):
         category1 = services.categories.create("Food", "Food expenses")
         category2 = services.categories.create("Transport", "Transport")
 
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Coffee,-5.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
         )
-        t1.data_import_id = data_import.id
-        t1.category_id = category1.id
-        services.transactions.create(t1)
 
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2024,Bus,-2.00,998.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 20),
-            post_date=None,
             description="Bus",
-            bank_category=None,
             amount=200,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category2.id,
         )
-        t2.data_import_id = data_import.id
-        t2.category_id = category2.id
-        services.transactions.create(t2)
 
-        t3 = Transaction.create_with_checksum(
-            raw_data="01/25/2024,Subscription,-120.00,996.00",
+        t3 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 25),
-            post_date=None,
             description="Food Subscription",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
         )
-        t3.data_import_id = data_import.id
-        t3.category_id = category1.id
-        t3.amortize_months = 12
-        t3.amortize_end_date = t3.transaction_date + relativedelta(months=11, day=31)
-        services.transactions.create(t3)
+        t3.set_amortization(12)
+        persist(services, t1, t2, t3)
 
         report = MonthTransactionsReport(services.db_manager)
         cash = report.run(2024, 1, "cash", category_ids=[category1.id])
@@ -212,24 +167,16 @@ class TestMonthTransactionsReport:
         assert cash.transactions == []
         assert accrual.transactions == []
 
-    def test_accrued_spans_multiple_months(self, services):
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        t = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Quarterly,-300.00,1000.00",
+    def test_accrued_spans_multiple_months(self, services, account, data_import):
+        t = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Quarterly Subscription",
-            bank_category=None,
             amount=30000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t.data_import_id = data_import.id
-        t.amortize_months = 3
-        t.amortize_end_date = t.transaction_date + relativedelta(months=2, day=31)
-        services.transactions.create(t)
+        t.set_amortization(3)
+        persist(services, t)
 
         report = MonthTransactionsReport(services.db_manager)
         for m in [1, 2, 3]:
@@ -0,0 +1,24 @@
+"""Tests for reports.months."""
+
+from reports.months import iter_months
+
+
+def test_iter_months_within_year():
+    assert list(iter_months(2024, 3, 2024, 5)) == [(2024, 3), (2024, 4), (2024, 5)]
+
+
+def test_iter_months_crosses_year_boundary():
+    assert list(iter_months(2024, 11, 2025, 2)) == [
+        (2024, 11),
+        (2024, 12),
+        (2025, 1),
+        (2025, 2),
+    ]
+
+
+def test_iter_months_single_month():
+    assert list(iter_months(2024, 12, 2024, 12)) == [(2024, 12)]
+
+
+def test_iter_months_end_before_start_is_empty():
+    assert list(iter_months(2024, 3, 2024, 1)) == []
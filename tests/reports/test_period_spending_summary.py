@@ -0,0 +1,113 @@
+"""Tests for PeriodSpendingSummaryReport."""
+
+from datetime import date
+
+import pytest
+
+from reports.period_spending_summary import PeriodSpendingSummaryReport
+from reports.period_transactions import PeriodTransactionsReport
+from tests.helpers import make_transaction, persist
+
+
+def _sum_transactions(month_transactions):
+    """Summarize a MonthTransactions by walking its Transaction objects."""
+    income = sum(
+        t.amount
+        for t in month_transactions.transactions
+        if t.transaction_type == "income"
+    )
+    by_category = {}
+    for t in month_transactions.transactions:
+        if t.transaction_type == "expense":
+            key = t.category_id or 0
+            by_category[key] = by_category.get(key, 0) + t.amount
+    expense = sum(by_category.values())
+    return (income, expense, income - expense, by_category)
+
+
+class TestPeriodSpendingSummaryReport:
+    def test_matches_summed_transactions(self, services, account, data_import):
+        category1 = services.categories.create("Food", "Food expenses")
+        category2 = services.categories.create("Transport", "Transport")
+        persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 1, 5),
+                description="Salary",
+                amount=200000,
+                transaction_type="income",
+                data_import_id=data_import.id,
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 1, 15),
+                description="Groceries",
+                amount=15000,
+                data_import_id=data_import.id,
+                category_id=category1.id,
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 3, 2),
+                description="Mystery expense",
+                amount=700,
+                data_import_id=data_import.id,
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 2, 10),
+                description="Annual Pass",
+                amount=10000,
+                data_import_id=data_import.id,
+                category_id=category2.id,
+                amortize_months=3,
+                amortize_end_date=date(2024, 4, 30),
+            ),
+        )
+
+        summaries = PeriodSpendingSummaryReport(services.db_manager)
+        transactions = PeriodTransactionsReport(services.db_manager)
+        for basis in ["cash", "accrual"]:
+            for category_ids in [None, [category2.id]]:
+                results = summaries.run(2023, 12, 2024, 5, basis, category_ids)
+                expected = transactions.run(2023, 12, 2024, 5, basis, category_ids)
+                assert [(r.year, r.month) for r in results] == [
+                    (m.year, m.month) for m in expected
+                ]
+                assert [
+                    (r.income_total, r.expense_total, r.net, r.expenses_by_category)
+                    for r in results
+                ] == [_sum_transactions(m) for m in expected]
+
+        for category_ids in [None, [category2.id]]:
+            assert summaries.run_cash_and_accrual(2023, 12, 2024, 5, category_ids) == (
+                summaries.run(2023, 12, 2024, 5, "cash", category_ids),
+                summaries.run(2023, 12, 2024, 5, "accrual", category_ids),
+            )
+
+    def test_empty_months_are_zero(self, services, account):
+        results = PeriodSpendingSummaryReport(services.db_manager).run(
+            2024, 11, 2025, 2, "accrual"
+        )
+
+        assert [(r.year, r.month) for r in results] == [
+            (2024, 11),
+            (2024, 12),
+            (2025, 1),
+            (2025, 2),
+        ]
+        for r in results:
+            assert r.basis == "accrual"
+            assert r.income_total == 0
+            assert r.expense_total == 0
+            assert r.net == 0
+            assert r.expenses_by_category == {}
+        # Each empty month gets its own dict, not one shared between months
+        assert results[0].expenses_by_category is not results[1].expenses_by_category
+
+    def test_invalid_basis_raises(self, services):
+        with pytest.raises(ValueError):
+            PeriodSpendingSummaryReport(services.db_manager).run(
+                2024, 1, 2024, 2, "weekly"
+            )
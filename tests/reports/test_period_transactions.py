@@ -0,0 +1,174 @@
+"""Tests for PeriodTransactionsReport."""
+
+from datetime import date
+
+import pytest
+
+from reports.month_transactions import MonthTransactionsReport
+from reports.period_transactions import PeriodTransactionsReport
+from tests.helpers import make_transaction, persist
+
+
+class TestPeriodTransactionsReport:
+    def test_multi_month_period(self, services, data_import):
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=data_import.account_id,
+                    transaction_date=date(2024, month, 15),
+                    description=f"Transaction {month}",
+                    amount=1000,
+                    data_import_id=data_import.id,
+                )
+                for month in [1, 2, 3]
+            ),
+        )
+
+        results = PeriodTransactionsReport(services.db_manager).run(
+            2024, 1, 2024, 3, "cash"
+        )
+
+        assert [(r.year, r.month) for r in results] == [(2024, 1), (2024, 2), (2024, 3)]
+        for r in results:
+            assert r.basis == "cash"
+            assert len(r.transactions) == 1
+            assert r.transactions[0].transaction_date.month == r.month
+
+    def test_cross_year_period(self, services, data_import):
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=data_import.account_id,
+                    transaction_date=txn_date,
+                    description=f"Transaction {txn_date.month}",
+                    amount=1000,
+                    data_import_id=data_import.id,
+                )
+                for txn_date in [
+                    date(2024, 11, 15),
+                    date(2024, 12, 15),
+                    date(2025, 1, 15),
+                ]
+            ),
+        )
+
+        results = PeriodTransactionsReport(services.db_manager).run(
+            2024, 11, 2025, 1, "cash"
+        )
+
+        assert [(r.year, r.month) for r in results] == [
+            (2024, 11),
+            (2024, 12),
+            (2025, 1),
+        ]
+        assert [len(r.transactions) for r in results] == [1, 1, 1]
+
+    def test_empty_months_included(self, services, data_import):
+        persist(
+            services,
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2024, 1, 15),
+                description="Coffee",
+                amount=500,
+                data_import_id=data_import.id,
+            ),
+        )
+
+        results = PeriodTransactionsReport(services.db_manager).run(
+            2024, 1, 2024, 4, "cash"
+        )
+
+        assert [r.month for r in results] == [1, 2, 3, 4]
+        assert [len(r.transactions) for r in results] == [1, 0, 0, 0]
+
+    def test_end_before_start_is_empty(self, services):
+        results = PeriodTransactionsReport(services.db_manager).run(
+            2024, 3, 2024, 1, "cash"
+        )
+
+        assert results == []
+
+    def test_matches_month_report_for_each_month(self, services, data_import):
+        category1 = services.categories.create("Food", "Food expenses")
+        category2 = services.categories.create("Transport", "Transport")
+        persist(
+            services,
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2024, 1, 31),
+                description="Coffee",
+                amount=500,
+                data_import_id=data_import.id,
+                category_id=category1.id,
+            ),
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2024, 3, 1),
+                description="Bus",
+                amount=200,
+                data_import_id=data_import.id,
+                category_id=category2.id,
+            ),
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2023, 12, 20),
+                description="Annual Subscription",
+                amount=12000,
+                data_import_id=data_import.id,
+                category_id=category1.id,
+                amortize_months=12,
+                amortize_end_date=date(2024, 11, 30),
+            ),
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2024, 2, 10),
+                description="Quarterly",
+                amount=10000,
+                data_import_id=data_import.id,
+                category_id=category2.id,
+                amortize_months=3,
+                amortize_end_date=date(2024, 4, 30),
+            ),
+        )
+
+        period = PeriodTransactionsReport(services.db_manager)
+        month_report = MonthTransactionsReport(services.db_manager)
+        for basis in ["cash", "accrual"]:
+            for category_ids in [None, [category1.id]]:
+                results = period.run(2024, 1, 2024, 5, basis, category_ids)
+                assert results == [
+                    month_report.run(2024, m, basis, category_ids) for m in range(1, 6)
+                ]
+
+    def test_accrued_spans_multiple_months(self, services, data_import):
+        persist(
+            services,
+            make_transaction(
+                account_id=data_import.account_id,
+                transaction_date=date(2024, 1, 15),
+                description="Quarterly Subscription",
+                amount=30000,
+                data_import_id=data_import.id,
+                amortize_months=3,
+                amortize_end_date=date(2024, 3, 31),
+            ),
+        )
+
+        results = PeriodTransactionsReport(services.db_manager).run(
+            2023, 12, 2024, 4, "accrual"
+        )
+
+        assert [len(r.transactions) for r in results] == [0, 1, 1, 1, 0]
+        for r in results[1:4]:
+            assert r.transactions[0].amount == 10000
+            assert r.transactions[0].transaction_date == date(r.year, r.month, 1)
+            assert r.transactions[0].accrued is True
+
+    def test_invalid_basis_raises(self, services):
+        with pytest.raises(ValueError):
+            PeriodTransactionsReport(services.db_manager).run(
+                2024, 1, 2024, 2, "weekly"
+            )
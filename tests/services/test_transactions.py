@@ -1,80 +1,160 @@
+import dataclasses
 import sqlite3
 from datetime import date, timedelta
 
 import pytest
 
 from models.transaction import Transaction
+from tests.helpers import make_transaction, persist
+
+# Only the tests that depend on checksum-derived IDs go through this.
+_mk = Transaction.create_with_checksum
+
+# Fixed "today" for the categorization-history tests. The query ignores the
+# current date, so a constant keeps the seeded rows identical across runs.
+_TODAY = date(2025, 6, 1)
+
+
+@pytest.fixture
+def historical_dataset(services, account, data_import):
+    """Seed an account with categorized and uncategorized transactions of varying age.
+
+    All rows, with their categories already set, go in through a single
+    bulk_create rather than one create + update per row.
+
+    Returns:
+        Tuple of (account, today) where today is the reference date the
+        transaction dates were computed from.
+    """
+    category = services.categories.create("Food", "Food expenses")
+
+    today = _TODAY
+    rows = [
+        (today - timedelta(days=30), category.id),  # Recent, has category
+        (today - timedelta(days=60), category.id),  # Mid-range, has category
+        (today - timedelta(days=100), category.id),  # Old, has category
+        (today - timedelta(days=30), None),  # Recent, no category
+    ]
+
+    transactions = []
+    for i, (txn_date, category_id) in enumerate(rows):
+        t = make_transaction(
+            account_id=account.id,
+            transaction_date=txn_date,
+            description=f"Transaction {i}",
+            amount=1000,
+            data_import_id=data_import.id,
+            category_id=category_id,
+        )
+        transactions.append(t)
+    persist(services, *transactions)
+
+    return account, today
 
 
 class TestTransactionService:
     """Tests for TransactionService."""
 
-    def test_create_transaction(self, services):
-        """Test creating a single transaction."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,STARBUCKS,-5.75,1000.00",
+    @pytest.mark.parametrize(
+        "overrides, expected",
+        [
+            pytest.param(
+                {},
+                {"description": "STARBUCKS", "amount": 575, "post_date": None},
+                id="basic",
+            ),
+            pytest.param(
+                {
+                    "additional_metadata": {
+                        "running_balance": "1234.56",
+                        "reference": "REF123",
+                    }
+                },
+                {
+                    "additional_metadata": {
+                        "running_balance": "1234.56",
+                        "reference": "REF123",
+                    }
+                },
+                id="metadata",
+            ),
+            pytest.param(
+                {"post_date": date(2025, 1, 16), "bank_category": "Shopping"},
+                {"post_date": date(2025, 1, 16), "bank_category": "Shopping"},
+                id="post_date",
+            ),
+            pytest.param(
+                {"merchant_name": "Amazon", "auto_merchant_name": "Amazon"},
+                {"merchant_name": "Amazon", "auto_merchant_name": "Amazon"},
+                id="merchant_name",
+            ),
+        ],
+    )
+    def test_create_and_find_round_trip(
+        self, services, account, data_import, overrides, expected
+    ):
+        """Test that a created transaction's fields survive a find() round-trip."""
+        transaction = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="STARBUCKS",
-            bank_category=None,
             amount=575,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        transaction.data_import_id = data_import.id
+        for field_name, value in overrides.items():
+            setattr(transaction, field_name, value)
 
         created = services.transactions.create(transaction)
 
         assert created.id == transaction.id
         assert created.account_id == account.id
-        assert created.description == "STARBUCKS"
-        assert created.amount == 575
 
-    def test_bulk_create_empty_list(self, services):
-        """Test bulk creating with empty list returns 0."""
+        found = services.transactions.find(transaction.id)
+
+        assert found is not None
+        assert found.id == transaction.id
+        for field_name, value in expected.items():
+            assert getattr(found, field_name) == value
+
+    def test_bulk_create_empty_list(self, services, monkeypatch):
+        """Test bulk creating with empty list returns 0 without touching the DB."""
+        connect_calls = []
+        real_connect = services.db_manager.connect
+
+        def counting_connect():
+            connect_calls.append(1)
+            return real_connect()
+
+        monkeypatch.setattr(services.db_manager, "connect", counting_connect)
+
         count = services.transactions.bulk_create([])
 
         assert count == 0
+        assert connect_calls == []  # no connection, no BEGIN/COMMIT
 
-    def test_bulk_create_multiple_transactions(self, services):
+    def test_bulk_create_multiple_transactions(self, services, account, data_import):
         """Test bulk creating multiple transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         transactions = [
-            Transaction.create_with_checksum(
-                raw_data=f"01/15/2025,TX{i},-{i}.00,1000.00",
+            make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15),
-                post_date=None,
                 description=f"Transaction {i}",
-                bank_category=None,
                 amount=i * 100,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
             for i in range(1, 4)
         ]
 
-        for t in transactions:
-            t.data_import_id = data_import.id
-
         count = services.transactions.bulk_create(transactions)
 
         assert count == 3
 
         # Verify they were created
-        found_transactions = services.transactions.find_by_account(account.id)
-        assert len(found_transactions) == 3
+        assert services.transactions.count_by_account(account.id) == 3
 
-    def test_bulk_create_with_duplicates_skips(self, services):
+    def test_bulk_create_with_duplicates_skips(self, services, account, data_import):
         """Test that bulk_create skips duplicate transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
+        transaction = _mk(
             raw_data="01/15/2025,DUPLICATE,-5.75,1000.00",
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
@@ -90,58 +170,75 @@ class TestTransactionService:
         services.transactions.create(transaction)
 
         # Count before
-        before_count = len(services.transactions.find_by_account(account.id))
+        before_count = services.transactions.count_by_account(account.id)
 
         # Try to bulk create with same transaction
         count = services.transactions.bulk_create([transaction])
 
         # Should skip the duplicate (INSERT OR IGNORE)
-        after_count = len(services.transactions.find_by_account(account.id))
+        after_count = services.transactions.count_by_account(account.id)
         assert after_count == before_count  # No new transactions added
-        assert count == 0  # rowcount reflects only this executemany, not prior inserts
+        assert count == 0  # count reflects only this call, not prior inserts
 
-    def test_bulk_create_count_unaffected_by_prior_inserts(self, services):
+    def test_bulk_create_count_unaffected_by_prior_inserts(
+        self, services, account, data_import
+    ):
         """Regression test: bulk_create count should reflect only the current batch.
 
         conn.total_changes counts all changes on the connection, so prior inserts
         would inflate the returned count. cursor.rowcount is scoped to the last statement.
         """
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
 
-        def make_transaction(i):
-            t = Transaction.create_with_checksum(
-                raw_data=f"01/15/2025,TX{i},-{i}.00,1000.00",
+        def make_txn(i):
+            return make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15),
-                post_date=None,
                 description=f"TX{i}",
-                bank_category=None,
                 amount=i * 100,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            return t
 
         # Pre-insert 5 transactions to dirty conn.total_changes
-        services.transactions.bulk_create([make_transaction(i) for i in range(1, 6)])
+        services.transactions.bulk_create([make_txn(i) for i in range(1, 6)])
 
         # Now insert only 2 new transactions
-        new_transactions = [make_transaction(i) for i in range(6, 8)]
+        new_transactions = [make_txn(i) for i in range(6, 8)]
         count = services.transactions.bulk_create(new_transactions)
 
         # Should be exactly 2, not 7 (2 + 5 prior)
         assert count == 2
 
-    def test_bulk_create_within_batch_collision_warns_and_drops(self, services, caplog):
+    @pytest.mark.parametrize("n", [499, 500, 501, 1500])
+    def test_bulk_create_spans_insert_chunks(self, services, account, data_import, n):
+        """Test that batches larger than one multi-row INSERT are fully inserted."""
+        transactions = [
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2025, 1, 15),
+                description=f"TX{i}",
+                amount=i,
+                data_import_id=data_import.id,
+            )
+            for i in range(n)
+        ]
+
+        count = services.transactions.bulk_create(transactions)
+
+        assert count == n
+        assert services.transactions.count_by_account(account.id) == n
+
+        # Re-inserting the same batch is skipped in every chunk
+        assert services.transactions.bulk_create(transactions) == 0
+
+    def test_bulk_create_within_batch_collision_warns_and_drops(
+        self, services, account, data_import, caplog
+    ):
         """Within-batch collision: duplicate IDs in the same batch trigger a warning
         and only the first entry is inserted."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
 
         # Two transactions with identical raw_data produce the same checksum ID.
         def make_collision(description):
-            t = Transaction.create_with_checksum(
+            t = _mk(
                 raw_data="01/15/2025,COFFEE SHOP,-4.50,1000.00",
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15),
@@ -165,84 +262,71 @@ class TestTransactionService:
 
         # Only the first entry should be inserted
         assert count == 1
-        found = services.transactions.find_by_account(account.id)
-        assert len(found) == 1
+        assert services.transactions.count_by_account(account.id) == 1
 
         # A warning should have been logged
         assert any("collision" in record.message.lower() for record in caplog.records)
 
-    def test_create_transaction_with_invalid_account_raises_fk_error(self, services):
+    def test_create_transaction_with_invalid_account_raises_fk_error(
+        self, services, account, data_import
+    ):
         """FK enforcement: creating a transaction with a non-existent account_id raises IntegrityError."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,STARBUCKS,-5.75,1000.00",
+        transaction = make_transaction(
             account_id=99999,  # does not exist
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="STARBUCKS",
-            bank_category=None,
             amount=575,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        transaction.data_import_id = data_import.id
 
         with pytest.raises(sqlite3.IntegrityError):
             services.transactions.create(transaction)
 
-    def test_find_transaction_by_id(self, services):
-        """Test finding a transaction by ID."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,FIND ME,-10.00,1000.00",
-            account_id=account.id,
-            transaction_date=date(2025, 1, 15),
-            post_date=None,
-            description="FIND ME",
-            bank_category=None,
-            amount=1000,
-            transaction_type="expense",
-        )
-        transaction.data_import_id = data_import.id
-        services.transactions.create(transaction)
-
-        found = services.transactions.find(transaction.id)
-
-        assert found is not None
-        assert found.id == transaction.id
-        assert found.description == "FIND ME"
-
     def test_find_transaction_by_id_not_found(self, services):
         """Test finding a non-existent transaction returns None."""
         found = services.transactions.find("nonexistent_id")
 
         assert found is None
 
-    def test_find_by_account(self, services):
-        """Test finding all transactions for an account."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
+    def test_find_many(self, services, account, data_import):
+        """Test fetching several transactions by ID in one call."""
+        t1, t2, _ = persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=date(2025, 1, 15),
+                    description=f"TX{i}",
+                    amount=i * 100,
+                    data_import_id=data_import.id,
+                )
+                for i in range(1, 4)
+            ),
+        )
+
+        found = services.transactions.find_many([t1.id, "nonexistent_id", t2.id, t1.id])
+
+        assert set(found) == {t1.id, t2.id}
+        assert found[t1.id].description == "TX1"
+        assert found[t2.id].amount == 200
 
+    def test_find_many_empty(self, services):
+        """Test that an empty ID list returns an empty dict."""
+        assert services.transactions.find_many([]) == {}
+
+    def test_find_by_account(self, services, account, data_import):
+        """Test finding all transactions for an account."""
         transactions = [
-            Transaction.create_with_checksum(
-                raw_data=f"01/{15 + i}/2025,TX{i},-{i}.00,1000.00",
+            make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15 + i),
-                post_date=None,
                 description=f"Transaction {i}",
-                bank_category=None,
                 amount=i * 100,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
             for i in range(3)
         ]
-
-        for t in transactions:
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+        persist(services, *transactions)
 
         found = services.transactions.find_by_account(account.id)
 
@@ -252,32 +336,25 @@ class TestTransactionService:
         assert found[1].transaction_date == date(2025, 1, 16)
         assert found[2].transaction_date == date(2025, 1, 15)
 
-    def test_find_by_account_empty(self, services):
+    def test_find_by_account_empty(self, services, account):
         """Test finding transactions for account with no transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-
         found = services.transactions.find_by_account(account.id)
 
         assert found == []
+        assert services.transactions.count_by_account(account.id) == 0
 
-    def test_update_category(self, services):
+    def test_update_category(self, services, account, data_import):
         """Test updating a transaction's category."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category = services.categories.create("Groceries", "Food shopping")
 
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,STORE,-50.00,1000.00",
+        transaction = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="STORE",
-            bank_category=None,
             amount=5000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        transaction.data_import_id = data_import.id
-        services.transactions.create(transaction)
+        persist(services, transaction)
 
         transaction.category_id = category.id
         result = services.transactions.update(transaction, ["category_id"])
@@ -308,87 +385,72 @@ class TestTransactionService:
 
         assert result is False
 
-    def test_batch_update_categories(self, services):
+    def test_batch_update_categories(self, services, account, data_import):
         """Test batch updating categories for multiple transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category = services.categories.create("Food", "Food expenses")
 
         transactions = []
         for i in range(3):
-            t = Transaction.create_with_checksum(
-                raw_data=f"01/1{5 + i}/2025,RESTAURANT{i},-20.00,1000.00",
+            t = make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15 + i),
-                post_date=None,
                 description=f"RESTAURANT{i}",
-                bank_category=None,
                 amount=2000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
-            t.category_id = category.id
             transactions.append(t)
+        persist(services, *transactions)
+
+        for t in transactions:
+            t.category_id = category.id
 
         count = services.transactions.batch_update(transactions, ["category_id"])
 
-        assert count >= 3  # total_changes is cumulative
+        assert count == 3
 
-        # Verify all were updated
-        for t in transactions:
-            found = services.transactions.find(t.id)
-            assert found.category_id == category.id
+        # Verify all were updated with one read instead of a find() per row
+        found = services.transactions.find_by_account(account.id)
+        assert len(found) == len(transactions)
+        assert all(f.category_id == category.id for f in found)
 
-    def test_batch_update_auto_categories(self, services):
+    def test_batch_update_auto_categories(self, services, account, data_import):
         """Test batch updating auto_category_id for multiple transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category = services.categories.create("AutoCat", "Auto category")
 
         transactions = []
         for i in range(2):
-            t = Transaction.create_with_checksum(
-                raw_data=f"01/1{5 + i}/2025,AUTO{i},-10.00,1000.00",
+            t = make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15 + i),
-                post_date=None,
                 description=f"AUTO{i}",
-                bank_category=None,
                 amount=1000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
-            t.auto_category_id = category.id
             transactions.append(t)
+        persist(services, *transactions)
+
+        for t in transactions:
+            t.auto_category_id = category.id
 
         count = services.transactions.batch_update(transactions, ["auto_category_id"])
 
-        assert count >= 2  # total_changes is cumulative
+        assert count == 2
 
-        # Verify all were updated
-        for t in transactions:
-            found = services.transactions.find(t.id)
-            assert found.auto_category_id == category.id
+        # Verify all were updated with one read instead of a find() per row
+        found = services.transactions.find_by_account(account.id)
+        assert len(found) == len(transactions)
+        assert all(f.auto_category_id == category.id for f in found)
 
-    def test_update_amortization(self, services):
+    def test_update_amortization(self, services, account, data_import):
         """Test updating amortization for a transaction."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,SUBSCRIPTION,-120.00,1000.00",
+        transaction = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="SUBSCRIPTION",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        transaction.data_import_id = data_import.id
-        services.transactions.create(transaction)
+        persist(services, transaction)
 
         end_date = date(2025, 12, 15)
         transaction.amortize_months = 12
@@ -404,60 +466,50 @@ class TestTransactionService:
         assert found.amortize_months == 12
         assert found.amortize_end_date == end_date
 
-    def test_batch_update_amortization(self, services):
+    def test_batch_update_amortization(self, services, account, data_import):
         """Test batch updating amortization for multiple transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         transactions = []
         for i in range(2):
-            t = Transaction.create_with_checksum(
-                raw_data=f"01/1{5 + i}/2025,SUB{i},-100.00,1000.00",
+            t = make_transaction(
                 account_id=account.id,
                 transaction_date=date(2025, 1, 15 + i),
-                post_date=None,
                 description=f"SUBSCRIPTION{i}",
-                bank_category=None,
                 amount=10000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+            transactions.append(t)
+        persist(services, *transactions)
+
+        for i, t in enumerate(transactions):
             t.amortize_months = 10
             t.amortize_end_date = date(2025, 11, 15 + i)
-            transactions.append(t)
 
         count = services.transactions.batch_update(
             transactions, ["amortize_months", "amortize_end_date"]
         )
 
-        assert count >= 2  # total_changes is cumulative
+        assert count == 2
 
-        # Verify all were updated
-        for t in transactions:
-            found = services.transactions.find(t.id)
-            assert found.amortize_months == 10
+        # Verify all were updated with one read instead of a find() per row
+        found = services.transactions.find_by_account(account.id)
+        assert len(found) == len(transactions)
+        assert all(f.amortize_months == 10 for f in found)
 
-    def test_get_transactions_by_date_range(self, services):
+    def test_get_transactions_by_date_range(self, services, account, data_import):
         """Test getting transactions by date range."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Create transactions across multiple months
         dates = [date(2025, 1, 15), date(2025, 2, 15), date(2025, 3, 15)]
+        transactions = []
         for i, txn_date in enumerate(dates):
-            t = Transaction.create_with_checksum(
-                raw_data=f"{txn_date.isoformat()},TX{i},-10.00,1000.00",
+            t = make_transaction(
                 account_id=account.id,
                 transaction_date=txn_date,
-                post_date=None,
                 description=f"Transaction {i}",
-                bank_category=None,
                 amount=1000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+            transactions.append(t)
+        persist(services, *transactions)
 
         # Get transactions for February
         found = services.transactions.get_transactions_by_date_range(
@@ -475,22 +527,22 @@ class TestTransactionService:
         data_import2 = services.data_imports.create(account2.id, "test2.csv.gz")
 
         # Create transactions for both accounts on the same date
-        for account, data_import in [
-            (account1, data_import1),
-            (account2, data_import2),
-        ]:
-            t = Transaction.create_with_checksum(
-                raw_data=f"2025-01-15,TX-{account.id},-10.00,1000.00",
-                account_id=account.id,
-                transaction_date=date(2025, 1, 15),
-                post_date=None,
-                description=f"Transaction for {account.name}",
-                bank_category=None,
-                amount=1000,
-                transaction_type="expense",
-            )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=date(2025, 1, 15),
+                    description=f"Transaction for {account.name}",
+                    amount=1000,
+                    data_import_id=data_import.id,
+                )
+                for account, data_import in [
+                    (account1, data_import1),
+                    (account2, data_import2),
+                ]
+            ),
+        )
 
         # Get transactions for account1 only
         found = services.transactions.get_transactions_by_date_range(
@@ -500,26 +552,21 @@ class TestTransactionService:
         assert len(found) == 1
         assert found[0].account_id == account1.id
 
-    def test_get_transactions_by_month(self, services):
+    def test_get_transactions_by_month(self, services, account, data_import):
         """Test getting transactions by month."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Create transactions in January and February
         dates = [date(2025, 1, 15), date(2025, 1, 20), date(2025, 2, 10)]
+        transactions = []
         for i, txn_date in enumerate(dates):
-            t = Transaction.create_with_checksum(
-                raw_data=f"{txn_date.isoformat()},TX{i},-10.00,1000.00",
+            t = make_transaction(
                 account_id=account.id,
                 transaction_date=txn_date,
-                post_date=None,
                 description=f"Transaction {i}",
-                bank_category=None,
                 amount=1000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
             )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
+            transactions.append(t)
+        persist(services, *transactions)
 
         # Get transactions for January 2025
         found = services.transactions.get_transactions_by_month(2025, 1)
@@ -527,39 +574,9 @@ class TestTransactionService:
         assert len(found) == 2
         assert all(t.transaction_date.month == 1 for t in found)
 
-    def test_find_historical_for_categorization(self, services):
+    def test_find_historical_for_categorization(self, historical_dataset, services):
         """Test finding historical categorized transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-        category = services.categories.create("Food", "Food expenses")
-
-        # Create transactions with different dates and categories
-        today = date.today()
-        dates = [
-            today - timedelta(days=30),  # Recent, has category
-            today - timedelta(days=60),  # Mid-range, has category
-            today - timedelta(days=100),  # Old, has category
-            today - timedelta(days=30),  # Recent, no category
-        ]
-
-        for i, txn_date in enumerate(dates):
-            t = Transaction.create_with_checksum(
-                raw_data=f"{txn_date.isoformat()},TX{i},-10.00,1000.00",
-                account_id=account.id,
-                transaction_date=txn_date,
-                post_date=None,
-                description=f"Transaction {i}",
-                bank_category=None,
-                amount=1000,
-                transaction_type="expense",
-            )
-            t.data_import_id = data_import.id
-            services.transactions.create(t)
-
-            # Set category for first 3 transactions only
-            if i < 3:
-                t.category_id = category.id
-                services.transactions.update(t, ["category_id"])
+        account, today = historical_dataset
 
         # Find historical categorized transactions
         found = services.transactions.find_historical_for_categorization(
@@ -573,28 +590,27 @@ class TestTransactionService:
         assert found[1].transaction_date == today - timedelta(days=60)
         assert found[2].transaction_date == today - timedelta(days=100)
 
-    def test_find_historical_for_categorization_with_limit(self, services):
+    def test_find_historical_for_categorization_with_limit(
+        self, services, account, data_import
+    ):
         """Test that limit parameter correctly restricts results."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category = services.categories.create("Food", "Food expenses")
 
         # Create 5 categorized transactions
-        today = date.today()
+        today = _TODAY
+        transactions = []
         for i in range(5):
-            t = Transaction.create_with_checksum(
-                raw_data=f"{(today - timedelta(days=i)).isoformat()},TX{i},-10.00,1000.00",
+            txn_date = today - timedelta(days=i)
+            t = make_transaction(
                 account_id=account.id,
-                transaction_date=today - timedelta(days=i),
-                post_date=None,
+                transaction_date=txn_date,
                 description=f"Transaction {i}",
-                bank_category=None,
                 amount=1000,
-                transaction_type="expense",
+                data_import_id=data_import.id,
+                category_id=category.id,
             )
-            t.data_import_id = data_import.id
-            t.category_id = category.id
-            services.transactions.create(t)
+            transactions.append(t)
+        persist(services, *transactions)
 
         # Find with limit of 3
         found = services.transactions.find_historical_for_categorization(
@@ -607,86 +623,29 @@ class TestTransactionService:
         assert found[1].transaction_date == today - timedelta(days=1)
         assert found[2].transaction_date == today - timedelta(days=2)
 
-    def test_transaction_with_metadata(self, services):
-        """Test creating and retrieving transaction with additional metadata."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        metadata = {"running_balance": "1234.56", "reference": "REF123"}
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,STORE,-50.00,1234.56",
-            account_id=account.id,
-            transaction_date=date(2025, 1, 15),
-            post_date=None,
-            description="STORE",
-            bank_category=None,
-            amount=5000,
-            transaction_type="expense",
-            additional_metadata=metadata,
-        )
-        transaction.data_import_id = data_import.id
-        services.transactions.create(transaction)
-
-        found = services.transactions.find(transaction.id)
-
-        assert found.additional_metadata == metadata
-
-    def test_transaction_with_post_date(self, services):
-        """Test creating transaction with post_date."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,01/16/2025,PENDING,-25.00,1000.00",
-            account_id=account.id,
-            transaction_date=date(2025, 1, 15),
-            post_date=date(2025, 1, 16),
-            description="PENDING",
-            bank_category="Shopping",
-            amount=2500,
-            transaction_type="expense",
-        )
-        transaction.data_import_id = data_import.id
-        services.transactions.create(transaction)
-
-        found = services.transactions.find(transaction.id)
-
-        assert found.post_date == date(2025, 1, 16)
-        assert found.bank_category == "Shopping"
-
-    def test_get_transactions_by_date_range_exclude_amortized(self, services):
+    def test_get_transactions_by_date_range_exclude_amortized(
+        self, services, account, data_import
+    ):
         """Test filtering out amortized transactions."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Create amortized transaction
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,Subscription,-100.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="Annual Subscription",
-            bank_category=None,
             amount=10000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            amortize_months=12,
         )
-        t1.data_import_id = data_import.id
-        t1.amortize_months = 12
-        services.transactions.create(t1)
 
         # Create regular transaction
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2025,Coffee,-5.00,995.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 20),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t2.data_import_id = data_import.id
-        services.transactions.create(t2)
+        persist(services, t1, t2)
 
         # Get all transactions
         all_txns = services.transactions.get_transactions_by_date_range(
@@ -701,56 +660,43 @@ class TestTransactionService:
         assert len(non_amortized) == 1
         assert non_amortized[0].description == "Coffee"
 
-    def test_get_transactions_by_date_range_filter_categories(self, services):
+    def test_get_transactions_by_date_range_filter_categories(
+        self, services, account, data_import
+    ):
         """Test filtering by category IDs."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category1 = services.categories.create("Food", "Food expenses")
         category2 = services.categories.create("Transport", "Transport")
 
         # Create transaction with category1
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,Coffee,-5.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
         )
-        t1.data_import_id = data_import.id
-        t1.category_id = category1.id
-        services.transactions.create(t1)
 
         # Create transaction with category2
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2025,Bus,-2.00,998.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 20),
-            post_date=None,
             description="Bus",
-            bank_category=None,
             amount=200,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category2.id,
         )
-        t2.data_import_id = data_import.id
-        t2.category_id = category2.id
-        services.transactions.create(t2)
 
         # Create transaction without category
-        t3 = Transaction.create_with_checksum(
-            raw_data="01/22/2025,Other,-3.00,995.00",
+        t3 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 22),
-            post_date=None,
             description="Other",
-            bank_category=None,
             amount=300,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t3.data_import_id = data_import.id
-        services.transactions.create(t3)
+
+        persist(services, t1, t2, t3)
 
         # Get all transactions
         all_txns = services.transactions.get_transactions_by_date_range(
@@ -777,42 +723,33 @@ class TestTransactionService:
         )
         assert len(empty_filter) == 3
 
-    def test_get_transactions_by_date_range_combined_filters(self, services):
+    def test_get_transactions_by_date_range_combined_filters(
+        self, services, account, data_import
+    ):
         """Test combining exclude_amortized and category filters."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category1 = services.categories.create("Food", "Food expenses")
 
         # Create amortized transaction with category1
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,Subscription,-100.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="Food Subscription",
-            bank_category=None,
             amount=10000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
+            amortize_months=12,
         )
-        t1.data_import_id = data_import.id
-        t1.category_id = category1.id
-        t1.amortize_months = 12
-        services.transactions.create(t1)
 
         # Create regular transaction with category1
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2025,Coffee,-5.00,995.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 20),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
         )
-        t2.data_import_id = data_import.id
-        t2.category_id = category1.id
-        services.transactions.create(t2)
+        persist(services, t1, t2)
 
         # Get Food category, exclude amortized
         filtered = services.transactions.get_transactions_by_date_range(
@@ -824,41 +761,32 @@ class TestTransactionService:
         assert len(filtered) == 1
         assert filtered[0].description == "Coffee"
 
-    def test_get_transactions_by_month_with_filters(self, services):
+    def test_get_transactions_by_month_with_filters(
+        self, services, account, data_import
+    ):
         """Test get_transactions_by_month with new filter parameters."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
         category1 = services.categories.create("Food", "Food expenses")
 
         # Create amortized transaction
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,Subscription,-100.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="Subscription",
-            bank_category=None,
             amount=10000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            amortize_months=12,
         )
-        t1.data_import_id = data_import.id
-        t1.amortize_months = 12
-        services.transactions.create(t1)
 
         # Create regular transaction with category
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2025,Coffee,-5.00,995.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 20),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
+            category_id=category1.id,
         )
-        t2.data_import_id = data_import.id
-        t2.category_id = category1.id
-        services.transactions.create(t2)
+        persist(services, t1, t2)
 
         # Get all for month
         all_month = services.transactions.get_transactions_by_month(2025, 1)
@@ -877,29 +805,21 @@ class TestTransactionService:
         assert len(food_only) == 1
         assert food_only[0].description == "Coffee"
 
-    def test_get_accrued_transactions_by_month_basic(self, services):
+    def test_get_accrued_transactions_by_month_basic(
+        self, services, account, data_import
+    ):
         """Test getting accrued transactions for a month."""
-        from dateutil.relativedelta import relativedelta
-
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Create transaction on Jan 15, 2024 with 12 month amortization
         # This should accrue in Jan 2024 - Dec 2024
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Annual Subscription,-120.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Annual Subscription",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        t1.amortize_months = 12
-        t1.amortize_end_date = t1.transaction_date + relativedelta(months=11, day=31)
-        services.transactions.create(t1)
+        t1.set_amortization(12)
+        persist(services, t1)
 
         # Get accrued for July 2024 (should include the transaction)
         accrued = services.transactions.get_accrued_transactions_by_month(2024, 7)
@@ -911,66 +831,77 @@ class TestTransactionService:
         assert accrued[0].accrued is True
         assert accrued[0].description == "Annual Subscription"
 
-    def test_get_accrued_transactions_by_month_boundary_dates(self, services):
+    def test_get_accrued_transactions_by_month_boundary_dates(
+        self, services, account, data_import
+    ):
         """Test accrual boundaries - first and last months."""
-        from dateutil.relativedelta import relativedelta
-
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Transaction on Jan 15, 2024, amortize for 12 months
         # End date: Dec 31, 2024
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Subscription,-120.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Subscription",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        t1.amortize_months = 12
-        t1.amortize_end_date = t1.transaction_date + relativedelta(months=11, day=31)
-        services.transactions.create(t1)
-
-        # Should accrue in January 2024 (first month)
-        jan_accrued = services.transactions.get_accrued_transactions_by_month(2024, 1)
-        assert len(jan_accrued) == 1
-
-        # Should accrue in December 2024 (last month)
-        dec_accrued = services.transactions.get_accrued_transactions_by_month(2024, 12)
-        assert len(dec_accrued) == 1
-
-        # Should NOT accrue in January 2025 (after end date)
-        jan_2025_accrued = services.transactions.get_accrued_transactions_by_month(
-            2025, 1
+        t1.set_amortization(12)
+        persist(services, t1)
+
+        # Accrues from the first month (Jan 2024) through the last (Dec 2024),
+        # and not in the months either side of that span.
+        for year, month, expected in [
+            (2023, 12, 0),
+            (2024, 1, 1),
+            (2024, 12, 1),
+            (2025, 1, 0),
+        ]:
+            accrued = services.transactions.get_accrued_transactions_by_month(
+                year, month
+            )
+            assert len(accrued) == expected, (year, month)
+
+        # The range query agrees with the per-month boundaries
+        by_month = services.transactions.get_accrued_transactions_by_months(
+            2023, 12, 2025, 1
         )
-        assert len(jan_2025_accrued) == 0
+        assert [len(m) for m in by_month] == [0] + [1] * 12 + [0]
 
-    def test_get_accrued_transactions_by_month_amount_rounding(self, services):
-        """Test that accrued amounts are rounded to nearest cent."""
-        from dateutil.relativedelta import relativedelta
+    def test_get_accrued_transactions_by_month_last_day_of_month(
+        self, services, account, data_import
+    ):
+        """Test that a transaction on the month's last day accrues from that month."""
+        t1 = make_transaction(
+            account_id=account.id,
+            transaction_date=date(2024, 1, 31),
+            description="Subscription",
+            amount=3000,
+            data_import_id=data_import.id,
+            amortize_months=3,
+            amortize_end_date=date(2024, 3, 31),
+        )
+        persist(services, t1)
 
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
+        assert (
+            len(services.transactions.get_accrued_transactions_by_month(2024, 1)) == 1
+        )
+        assert (
+            len(services.transactions.get_accrued_transactions_by_month(2023, 12)) == 0
+        )
 
+    def test_get_accrued_transactions_by_month_amount_rounding(
+        self, services, account, data_import
+    ):
+        """Test that accrued amounts are rounded to nearest cent."""
         # Amount that doesn't divide evenly: 10000 cents / 3 = 3333.33...
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/01/2024,Quarterly,-100.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 1),
-            post_date=None,
             description="Quarterly",
-            bank_category=None,
             amount=10000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        t1.amortize_months = 3
-        t1.amortize_end_date = t1.transaction_date + relativedelta(months=2, day=31)
-        services.transactions.create(t1)
+        t1.set_amortization(3)
+        persist(services, t1)
 
         accrued = services.transactions.get_accrued_transactions_by_month(2024, 1)
 
@@ -979,8 +910,6 @@ class TestTransactionService:
 
     def test_get_accrued_transactions_by_month_with_filters(self, services):
         """Test filtering accrued transactions by account and category."""
-        from dateutil.relativedelta import relativedelta
-
         account1 = services.accounts.create("account1", "bofa", "Account 1")
         account2 = services.accounts.create("account2", "chase", "Account 2")
         data_import1 = services.data_imports.create(account1.id, "test1.csv.gz")
@@ -989,38 +918,27 @@ class TestTransactionService:
         category2 = services.categories.create("Entertainment", "Entertainment")
 
         # Transaction in account1 with category1
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/01/2024,Software,-120.00,1000.00",
+        t1 = make_transaction(
             account_id=account1.id,
             transaction_date=date(2024, 1, 1),
-            post_date=None,
             description="Software",
-            bank_category=None,
             amount=12000,
-            transaction_type="expense",
+            data_import_id=data_import1.id,
+            category_id=category1.id,
         )
-        t1.data_import_id = data_import1.id
-        t1.category_id = category1.id
-        t1.amortize_months = 12
-        t1.amortize_end_date = t1.transaction_date + relativedelta(months=11, day=31)
-        services.transactions.create(t1)
+        t1.set_amortization(12)
 
         # Transaction in account2 with category2
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/01/2024,Streaming,-60.00,1000.00",
+        t2 = make_transaction(
             account_id=account2.id,
             transaction_date=date(2024, 1, 1),
-            post_date=None,
             description="Streaming",
-            bank_category=None,
             amount=6000,
-            transaction_type="expense",
+            data_import_id=data_import2.id,
+            category_id=category2.id,
         )
-        t2.data_import_id = data_import2.id
-        t2.category_id = category2.id
-        t2.amortize_months = 12
-        t2.amortize_end_date = t2.transaction_date + relativedelta(months=11, day=31)
-        services.transactions.create(t2)
+        t2.set_amortization(12)
+        persist(services, t1, t2)
 
         # Get all accrued
         all_accrued = services.transactions.get_accrued_transactions_by_month(2024, 6)
@@ -1046,24 +964,19 @@ class TestTransactionService:
         )
         assert len(multi_category) == 2
 
-    def test_get_accrued_transactions_excludes_non_amortized(self, services):
+    def test_get_accrued_transactions_excludes_non_amortized(
+        self, services, account, data_import
+    ):
         """Test that non-amortized transactions are not included."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Regular transaction without amortization
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2024,Coffee,-5.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2024, 1, 15),
-            post_date=None,
             description="Coffee",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        services.transactions.create(t1)
+        persist(services, t1)
 
         # Get accrued for January 2024
         accrued = services.transactions.get_accrued_transactions_by_month(2024, 1)
@@ -1071,64 +984,25 @@ class TestTransactionService:
         # Should be empty since transaction has no amortization
         assert len(accrued) == 0
 
-    def test_create_transaction_with_merchant_name(self, services):
-        """Test creating a transaction with merchant_name fields."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        transaction = Transaction.create_with_checksum(
-            raw_data="01/15/2025,AMAZON.COM*123ABC,-25.00,1000.00",
-            account_id=account.id,
-            transaction_date=date(2025, 1, 15),
-            post_date=None,
-            description="AMAZON.COM*123ABC",
-            bank_category=None,
-            amount=2500,
-            transaction_type="expense",
-        )
-        transaction.data_import_id = data_import.id
-        transaction.merchant_name = "Amazon"
-        transaction.auto_merchant_name = "Amazon"
-
-        created = services.transactions.create(transaction)
-
-        # Retrieve and verify
-        found = services.transactions.find(created.id)
-        assert found is not None
-        assert found.merchant_name == "Amazon"
-        assert found.auto_merchant_name == "Amazon"
-
-    def test_batch_update_merchant_names(self, services):
+    def test_batch_update_merchant_names(self, services, account, data_import):
         """Test batch updating merchant_name and auto_merchant_name."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
         # Create transactions
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,AMAZON.COM,-25.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="AMAZON.COM",
-            bank_category=None,
             amount=2500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        services.transactions.create(t1)
 
-        t2 = Transaction.create_with_checksum(
-            raw_data="01/20/2025,STARBUCKS,-5.00,995.00",
+        t2 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 20),
-            post_date=None,
             description="STARBUCKS",
-            bank_category=None,
             amount=500,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t2.data_import_id = data_import.id
-        services.transactions.create(t2)
+        persist(services, t1, t2)
 
         # Update merchant names
         t1.merchant_name = "Amazon"
@@ -1139,29 +1013,21 @@ class TestTransactionService:
         assert updated_count == 2
 
         # Verify updates
-        found_t1 = services.transactions.find(t1.id)
-        found_t2 = services.transactions.find(t2.id)
+        found = services.transactions.find_many([t1.id, t2.id])
 
-        assert found_t1.merchant_name == "Amazon"
-        assert found_t2.merchant_name == "Starbucks"
+        assert found[t1.id].merchant_name == "Amazon"
+        assert found[t2.id].merchant_name == "Starbucks"
 
-    def test_batch_update_auto_merchant_names(self, services):
+    def test_batch_update_auto_merchant_names(self, services, account, data_import):
         """Test batch updating auto_merchant_name."""
-        account = services.accounts.create("test_account", "bofa", "Test Account")
-        data_import = services.data_imports.create(account.id, "test.csv.gz")
-
-        t1 = Transaction.create_with_checksum(
-            raw_data="01/15/2025,WAL-MART #123,-50.00,1000.00",
+        t1 = make_transaction(
             account_id=account.id,
             transaction_date=date(2025, 1, 15),
-            post_date=None,
             description="WAL-MART #123",
-            bank_category=None,
             amount=5000,
-            transaction_type="expense",
+            data_import_id=data_import.id,
         )
-        t1.data_import_id = data_import.id
-        services.transactions.create(t1)
+        persist(services, t1)
 
         # Update auto_merchant_name
         t1.auto_merchant_name = "Walmart"
@@ -1173,3 +1039,294 @@ class TestTransactionService:
         # Verify
         found = services.transactions.find(t1.id)
         assert found.auto_merchant_name == "Walmart"
+
+    def test_batch_update_spans_update_chunks(self, services, account, data_import):
+        """Test that batches larger than one UPDATE ... FROM chunk are fully applied."""
+        category = services.categories.create("Food", "Food expenses")
+        transactions = persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=date(2025, 1, 15),
+                    description=f"TX{i}",
+                    amount=i,
+                    data_import_id=data_import.id,
+                )
+                for i in range(1200)
+            ),
+        )
+
+        for t in transactions:
+            t.category_id = category.id
+            t.merchant_name = t.description.lower()
+
+        count = services.transactions.batch_update(
+            transactions, ["category_id", "merchant_name"]
+        )
+
+        assert count == 1200
+        found = services.transactions.find_by_account(account.id)
+        assert all(f.category_id == category.id for f in found)
+        assert all(f.merchant_name == f.description.lower() for f in found)
+
+    def test_batch_update_duplicate_ids_last_wins(self, services, account, data_import):
+        """Test that a repeated ID in one batch takes its last value, like per-row updates."""
+        t1, t2 = persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2025, 1, 15),
+                description="AMAZON.COM",
+                amount=2500,
+                data_import_id=data_import.id,
+                merchant_name="Old",
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2025, 1, 20),
+                description="STARBUCKS",
+                amount=500,
+                data_import_id=data_import.id,
+            ),
+        )
+        first = dataclasses.replace(t1, merchant_name="Amazon")
+        second = dataclasses.replace(t1, merchant_name=None)
+        t2.merchant_name = "Starbucks"
+
+        count = services.transactions.batch_update(
+            [first, t2, second], ["merchant_name"]
+        )
+
+        assert count == 2
+        found = services.transactions.find_many([t1.id, t2.id])
+        assert found[t1.id].merchant_name is None
+        assert found[t2.id].merchant_name == "Starbucks"
+
+    def test_batch_update_ignores_missing_ids(self, services, account, data_import):
+        """Test that IDs not in the database are not counted as updated."""
+        (t1,) = persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2025, 1, 15),
+                description="STORE",
+                amount=5000,
+                data_import_id=data_import.id,
+            ),
+        )
+        missing = make_transaction(
+            account_id=account.id,
+            transaction_date=date(2025, 1, 15),
+            description="MISSING",
+            amount=100,
+        )
+        t1.merchant_name = missing.merchant_name = "Store"
+
+        count = services.transactions.batch_update([t1, missing], ["merchant_name"])
+
+        assert count == 1
+
+    def test_get_totals_by_months(self, services, account, data_import):
+        """Test that per-month totals are grouped by type and category."""
+        category = services.categories.create("Food", "Food expenses")
+        persist(
+            services,
+            *(
+                make_transaction(
+                    account_id=account.id,
+                    transaction_date=txn_date,
+                    description=f"TX{i}",
+                    amount=amount,
+                    data_import_id=data_import.id,
+                    **fields,
+                )
+                for i, (txn_date, amount, fields) in enumerate(
+                    [
+                        (date(2024, 12, 31), 100, {"category_id": category.id}),
+                        (date(2024, 12, 1), 250, {"category_id": category.id}),
+                        (date(2024, 12, 5), 40, {}),
+                        (date(2024, 12, 6), 5000, {"transaction_type": "income"}),
+                        (date(2025, 2, 1), 70, {}),
+                        (date(2025, 3, 1), 999, {}),  # after the range
+                        (
+                            date(2024, 12, 10),
+                            1200,
+                            {
+                                "amortize_months": 12,
+                                "amortize_end_date": date(2025, 11, 30),
+                            },
+                        ),
+                    ]
+                )
+            ),
+        )
+
+        totals = services.transactions.get_totals_by_months(
+            2024, 12, 2025, 2, exclude_amortized=True
+        )
+
+        assert len(totals) == 3
+        assert sorted(totals[0], key=repr) == sorted(
+            [
+                ("expense", category.id, 350),
+                ("expense", 0, 40),
+                ("income", 0, 5000),
+            ],
+            key=repr,
+        )
+        assert totals[1] == []
+        assert totals[2] == [("expense", 0, 70)]
+
+        with_amortized = services.transactions.get_totals_by_months(2024, 12, 2024, 12)
+        assert ("expense", 0, 1240) in with_amortized[0]
+
+        assert services.transactions.get_totals_by_months(2025, 2, 2024, 12) == []
+
+    def test_get_accrued_totals_by_months(self, services, account, data_import):
+        """Test that accrued totals match summing the accrued transactions."""
+        category = services.categories.create("Software", "Software")
+        persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 11, 20),
+                description="Annual",
+                amount=10000,  # round(10000 / 3) = 3333 per month
+                data_import_id=data_import.id,
+                category_id=category.id,
+                amortize_months=3,
+                amortize_end_date=date(2025, 1, 31),
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 12, 31),
+                description="Quarterly",
+                amount=600,
+                data_import_id=data_import.id,
+                amortize_months=2,
+                amortize_end_date=date(2025, 1, 31),
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 12, 15),
+                description="Coffee",
+                amount=500,
+                data_import_id=data_import.id,
+            ),
+        )
+
+        totals = services.transactions.get_accrued_totals_by_months(2024, 12, 2025, 2)
+
+        assert [sorted(month, key=repr) for month in totals] == [
+            [("expense", 0, 300), ("expense", category.id, 3333)],
+            [("expense", 0, 300), ("expense", category.id, 3333)],
+            [],
+        ]
+        assert services.transactions.get_accrued_totals_by_months(
+            2024, 12, 2024, 12, category_ids=[category.id]
+        ) == [[("expense", category.id, 3333)]]
+
+    def test_get_cash_and_accrued_totals_by_months(
+        self, services, account, data_import
+    ):
+        """Test that the combined query matches the per-basis totals queries."""
+        other = services.accounts.create("other", "chase", "Other Account")
+        other_import = services.data_imports.create(other.id, "other.csv.gz")
+        category = services.categories.create("Software", "Software")
+        persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 12, 5),
+                description="Coffee",
+                amount=500,
+                data_import_id=data_import.id,
+                category_id=category.id,
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 12, 6),
+                description="Salary",
+                amount=90000,
+                data_import_id=data_import.id,
+                transaction_type="income",
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(2024, 11, 20),
+                description="Annual",
+                amount=10000,
+                data_import_id=data_import.id,
+                category_id=category.id,
+                amortize_months=3,
+                amortize_end_date=date(2025, 1, 31),
+            ),
+            make_transaction(
+                account_id=other.id,
+                transaction_date=date(2025, 1, 2),
+                description="Other",
+                amount=800,
+                data_import_id=other_import.id,
+            ),
+        )
+
+        repo = services.transactions
+        for filters in [
+            {},
+            {"account_id": account.id},
+            {"category_ids": [category.id]},
+        ]:
+            cash, accrual = repo.get_cash_and_accrued_totals_by_months(
+                2024, 12, 2025, 2, **filters
+            )
+            expected_cash = repo.get_totals_by_months(
+                2024, 12, 2025, 2, exclude_amortized=True, **filters
+            )
+            expected_accrual = repo.get_accrued_totals_by_months(
+                2024, 12, 2025, 2, **filters
+            )
+            assert [sorted(m) for m in cash] == [sorted(m) for m in expected_cash]
+            assert [sorted(m) for m in accrual] == [sorted(m) for m in expected_accrual]
+
+        assert repo.get_cash_and_accrued_totals_by_months(2025, 2, 2024, 12) == ([], [])
+
+    def test_month_range_queries_through_december_9999(
+        self, services, account, data_import
+    ):
+        """Test that ranges ending in the last representable month don't overflow."""
+        persist(
+            services,
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(9999, 12, 31),
+                description="Coffee",
+                amount=500,
+                data_import_id=data_import.id,
+            ),
+            make_transaction(
+                account_id=account.id,
+                transaction_date=date(9999, 12, 31),
+                description="Annual",
+                amount=1200,
+                data_import_id=data_import.id,
+                amortize_months=1,
+                amortize_end_date=date(9999, 12, 31),
+            ),
+        )
+
+        repo = services.transactions
+        assert len(repo.get_transactions_by_months(9999, 12, 9999, 12)[0]) == 2
+        assert repo.get_totals_by_months(
+            9999, 12, 9999, 12, exclude_amortized=True
+        ) == [[("expense", 0, 500)]]
+        assert [
+            t.description for t in repo.get_accrued_transactions_by_month(9999, 12)
+        ] == ["Annual"]
+        assert repo.get_accrued_totals_by_months(9999, 12, 9999, 12) == [
+            [("expense", 0, 1200)]
+        ]
+        assert repo.get_cash_and_accrued_totals_by_months(9999, 11, 9999, 12) == (
+            [[], [("expense", 0, 500)]],
+            [[], [("expense", 0, 1200)]],
+        )
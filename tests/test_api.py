@@ -188,6 +188,12 @@ class TestSummaryAPI:
         assert data["cash_basis"]["2025/01"]["income_total"] == 0
         assert data["cash_basis"]["2025/01"]["expense_total"] == 0
 
+    def test_summary_december_9999(self, client, account):
+        resp = client.get("/api/transactions/summary?start=9999/12&end=9999/12")
+        assert resp.status_code == 200
+        assert resp.json["cash_basis"]["9999/12"]["expense_total"] == 0
+        assert resp.json["accrual_basis"]["9999/12"]["expense_total"] == 0
+
     def test_summary_with_transactions(self, client, transaction):
         resp = client.get("/api/transactions/summary?start=2025/03&end=2025/03")
         assert resp.status_code == 200
@@ -196,3 +202,12 @@ class TestSummaryAPI:
         assert month["expense_total"] == 4200
         assert month["income_total"] == 0
         assert month["net"] == -4200
+
+    def test_summary_multi_month_cross_year(self, client, transaction):
+        resp = client.get("/api/transactions/summary?start=2024/12&end=2025/03")
+        assert resp.status_code == 200
+        data = resp.json
+        keys = ["2024/12", "2025/01", "2025/02", "2025/03"]
+        assert list(data["cash_basis"]) == keys
+        assert list(data["accrual_basis"]) == keys
+        assert [data["cash_basis"][k]["expense_total"] for k in keys] == [0, 0, 0, 4200]